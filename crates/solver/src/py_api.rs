@@ -1,4 +1,7 @@
-use numpy::{PyArray1, PyReadonlyArray1, PyReadonlyArray2, PyUntypedArrayMethods};
+use numpy::ndarray::Array2;
+use numpy::{
+    IntoPyArray, PyArray1, PyArray2, PyReadonlyArray1, PyReadonlyArray2, PyUntypedArrayMethods,
+};
 use pyo3::prelude::*;
 
 use crate::kernel::{build_kernel, compute_lipschitz};
@@ -225,52 +228,192 @@ fn configure_solver_options(
     Ok(())
 }
 
-/// One-shot deconvolution for a single 1D trace.
-/// Returns (activity, baseline, reconvolution, iterations, converged).
-#[pyfunction]
-#[pyo3(signature = (trace, fs, tau_rise, tau_decay, lambda_, hp_enabled=false, lp_enabled=false, max_iters=2000, conv_mode="fft", constraint="nonneg"))]
-fn deconvolve_single<'py>(
-    py: Python<'py>,
-    trace: PyReadonlyArray1<f64>,
-    fs: f64,
+/// Per-trace deconvolution result: (activity, baseline, reconvolution,
+/// iterations, converged).
+type DeconTuple<'py> = (
+    Bound<'py, PyArray1<f32>>,
+    f64,
+    Bound<'py, PyArray1<f32>>,
+    u32,
+    bool,
+);
+
+/// Batch deconvolution result as struct-of-arrays: the per-cell rows are
+/// packed into contiguous (n_cells, n_timepoints) matrices wrapped
+/// zero-copy, instead of a Python list of per-row arrays.
+type BatchDeconTuple<'py> = (
+    Bound<'py, PyArray2<f32>>,
+    Vec<f64>,
+    Bound<'py, PyArray2<f32>>,
+    Vec<u32>,
+    Vec<bool>,
+);
+
+/// Accumulator that packs per-trace results into the batch return columns.
+struct BatchResults {
+    activities: Vec<f32>,
+    baselines: Vec<f64>,
+    reconvolutions: Vec<f32>,
+    iterations: Vec<u32>,
+    convergeds: Vec<bool>,
+}
+
+impl BatchResults {
+    fn with_capacity(n_cells: usize, n_timepoints: usize) -> Self {
+        Self {
+            activities: Vec::with_capacity(n_cells * n_timepoints),
+            baselines: Vec::with_capacity(n_cells),
+            reconvolutions: Vec::with_capacity(n_cells * n_timepoints),
+            iterations: Vec::with_capacity(n_cells),
+            convergeds: Vec::with_capacity(n_cells),
+        }
+    }
+
+    fn push_from_solver(&mut self, solver: &mut Solver) {
+        self.activities.extend(solver.get_solution());
+        self.baselines.push(solver.get_baseline());
+        self.reconvolutions
+            .extend(solver.get_reconvolution_with_baseline());
+        self.iterations.push(solver.iteration_count());
+        self.convergeds.push(solver.converged());
+    }
+
+    fn into_tuple<'py>(self, py: Python<'py>, n_cells: usize) -> BatchDeconTuple<'py> {
+        let n_timepoints = if n_cells > 0 {
+            self.activities.len() / n_cells
+        } else {
+            0
+        };
+        let activities = Array2::from_shape_vec((n_cells, n_timepoints), self.activities)
+            .expect("rows are uniform length")
+            .into_pyarray(py);
+        let reconvolutions = Array2::from_shape_vec((n_cells, n_timepoints), self.reconvolutions)
+            .expect("rows are uniform length")
+            .into_pyarray(py);
+        (
+            activities,
+            self.baselines,
+            reconvolutions,
+            self.iterations,
+            self.convergeds,
+        )
+    }
+}
+
+/// Build a solver configured for the deconvolve_* entry points.
+fn new_decon_solver(
     tau_rise: f64,
     tau_decay: f64,
     lambda_: f64,
+    fs: f64,
     hp_enabled: bool,
     lp_enabled: bool,
-    max_iters: u32,
     conv_mode: &str,
     constraint: &str,
-) -> PyResult<(
-    Bound<'py, PyArray1<f32>>,
-    f64,
-    Bound<'py, PyArray1<f32>>,
-    u32,
-    bool,
-)> {
+) -> PyResult<Solver> {
     let mut solver = Solver::new();
     solver.set_params(tau_rise, tau_decay, lambda_, fs);
     configure_solver_options(&mut solver, conv_mode, constraint)?;
-
-    let trace_f32 = to_f32_vec(&trace)?;
-    solver.set_trace(&trace_f32);
-
     if hp_enabled || lp_enabled {
         solver.set_hp_filter_enabled(hp_enabled);
         solver.set_lp_filter_enabled(lp_enabled);
-        solver.apply_filter();
     }
+    Ok(solver)
+}
 
+/// Run one trace through an already-configured solver, leaving the
+/// result readable from the solver's getters.
+fn solve_one(solver: &mut Solver, trace_f32: &[f32], filter_enabled: bool, max_iters: u32) {
+    solver.set_trace(trace_f32);
+    if filter_enabled {
+        solver.apply_filter();
+    }
     solver.subtract_baseline();
+    run_to_convergence(solver, max_iters);
+}
 
-    run_to_convergence(&mut solver, max_iters);
-
-    Ok((
+/// Run one trace through an already-configured solver.
+fn deconvolve_one<'py>(
+    py: Python<'py>,
+    solver: &mut Solver,
+    trace_f32: &[f32],
+    filter_enabled: bool,
+    max_iters: u32,
+) -> DeconTuple<'py> {
+    solve_one(solver, trace_f32, filter_enabled, max_iters);
+    (
         PyArray1::from_vec(py, solver.get_solution()),
         solver.get_baseline(),
         PyArray1::from_vec(py, solver.get_reconvolution_with_baseline()),
         solver.iteration_count(),
         solver.converged(),
+    )
+}
+
+/// One-shot deconvolution for a single 1D trace.
+/// Returns (activity, baseline, reconvolution, iterations, converged).
+#[pyfunction]
+#[pyo3(signature = (trace, fs, tau_rise, tau_decay, lambda_, hp_enabled=false, lp_enabled=false, max_iters=2000, conv_mode="fft", constraint="nonneg"))]
+fn deconvolve_single<'py>(
+    py: Python<'py>,
+    trace: PyReadonlyArray1<f64>,
+    fs: f64,
+    tau_rise: f64,
+    tau_decay: f64,
+    lambda_: f64,
+    hp_enabled: bool,
+    lp_enabled: bool,
+    max_iters: u32,
+    conv_mode: &str,
+    constraint: &str,
+) -> PyResult<DeconTuple<'py>> {
+    let mut solver = new_decon_solver(
+        tau_rise, tau_decay, lambda_, fs, hp_enabled, lp_enabled, conv_mode, constraint,
+    )?;
+    let trace_f32 = to_f32_vec(&trace)?;
+    Ok(deconvolve_one(
+        py,
+        &mut solver,
+        &trace_f32,
+        hp_enabled || lp_enabled,
+        max_iters,
+    ))
+}
+
+/// `deconvolve_single` for f32 input: the solver works in f32 internally,
+/// so a float32 trace is borrowed directly with no widening copy.
+#[pyfunction]
+#[pyo3(signature = (trace, fs, tau_rise, tau_decay, lambda_, hp_enabled=false, lp_enabled=false, max_iters=2000, conv_mode="fft", constraint="nonneg"))]
+fn deconvolve_single_f32<'py>(
+    py: Python<'py>,
+    trace: PyReadonlyArray1<f32>,
+    fs: f64,
+    tau_rise: f64,
+    tau_decay: f64,
+    lambda_: f64,
+    hp_enabled: bool,
+    lp_enabled: bool,
+    max_iters: u32,
+    conv_mode: &str,
+    constraint: &str,
+) -> PyResult<DeconTuple<'py>> {
+    let mut solver = new_decon_solver(
+        tau_rise, tau_decay, lambda_, fs, hp_enabled, lp_enabled, conv_mode, constraint,
+    )?;
+    let slice = trace
+        .as_slice()
+        .map_err(|_| pyo3::exceptions::PyValueError::new_err(CONTIGUOUS_ERR))?;
+    if let Some(i) = crate::first_nonfinite(slice) {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "{NONFINITE_ERR} at index {i}"
+        )));
+    }
+    Ok(deconvolve_one(
+        py,
+        &mut solver,
+        slice,
+        hp_enabled || lp_enabled,
+        max_iters,
     ))
 }
 
@@ -290,33 +433,18 @@ fn deconvolve_batch<'py>(
     max_iters: u32,
     conv_mode: &str,
     constraint: &str,
-) -> PyResult<(
-    Vec<Bound<'py, PyArray1<f32>>>,
-    Vec<f64>,
-    Vec<Bound<'py, PyArray1<f32>>>,
-    Vec<u32>,
-    Vec<bool>,
-)> {
+) -> PyResult<BatchDeconTuple<'py>> {
     let shape = traces.shape();
     let n_cells = shape[0];
+    let n_timepoints = shape[1];
 
-    let mut solver = Solver::new();
-    solver.set_params(tau_rise, tau_decay, lambda_, fs);
-    configure_solver_options(&mut solver, conv_mode, constraint)?;
-
-    if hp_enabled || lp_enabled {
-        solver.set_hp_filter_enabled(hp_enabled);
-        solver.set_lp_filter_enabled(lp_enabled);
-    }
-
-    let mut activities = Vec::with_capacity(n_cells);
-    let mut baselines = Vec::with_capacity(n_cells);
-    let mut reconvolutions = Vec::with_capacity(n_cells);
-    let mut iterations = Vec::with_capacity(n_cells);
-    let mut convergeds = Vec::with_capacity(n_cells);
+    let mut solver = new_decon_solver(
+        tau_rise, tau_decay, lambda_, fs, hp_enabled, lp_enabled, conv_mode, constraint,
+    )?;
+    let filter_enabled = hp_enabled || lp_enabled;
 
+    let mut results = BatchResults::with_capacity(n_cells, n_timepoints);
     let traces_ref = traces.as_array();
-    let n_timepoints = shape[1];
     let mut trace_f32: Vec<f32> = Vec::with_capacity(n_timepoints);
 
     for cell_idx in 0..n_cells {
@@ -327,33 +455,56 @@ fn deconvolve_batch<'py>(
                 "{NONFINITE_ERR} at row {cell_idx}, index {i}"
             )));
         }
-        solver.set_trace(&trace_f32);
+        solve_one(&mut solver, &trace_f32, filter_enabled, max_iters);
+        results.push_from_solver(&mut solver);
+    }
 
-        if hp_enabled || lp_enabled {
-            solver.apply_filter();
-        }
+    Ok(results.into_tuple(py, n_cells))
+}
 
-        solver.subtract_baseline();
+/// `deconvolve_batch` for f32 input: rows are borrowed directly from the
+/// numpy array, skipping the per-row f64 -> f32 widening copy.
+#[pyfunction]
+#[pyo3(signature = (traces, fs, tau_rise, tau_decay, lambda_, hp_enabled=false, lp_enabled=false, max_iters=2000, conv_mode="fft", constraint="nonneg"))]
+fn deconvolve_batch_f32<'py>(
+    py: Python<'py>,
+    traces: PyReadonlyArray2<f32>,
+    fs: f64,
+    tau_rise: f64,
+    tau_decay: f64,
+    lambda_: f64,
+    hp_enabled: bool,
+    lp_enabled: bool,
+    max_iters: u32,
+    conv_mode: &str,
+    constraint: &str,
+) -> PyResult<BatchDeconTuple<'py>> {
+    let shape = traces.shape();
+    let n_cells = shape[0];
 
-        run_to_convergence(&mut solver, max_iters);
+    let mut solver = new_decon_solver(
+        tau_rise, tau_decay, lambda_, fs, hp_enabled, lp_enabled, conv_mode, constraint,
+    )?;
+    let filter_enabled = hp_enabled || lp_enabled;
 
-        activities.push(PyArray1::from_vec(py, solver.get_solution()));
-        baselines.push(solver.get_baseline());
-        reconvolutions.push(PyArray1::from_vec(
-            py,
-            solver.get_reconvolution_with_baseline(),
-        ));
-        iterations.push(solver.iteration_count());
-        convergeds.push(solver.converged());
+    let mut results = BatchResults::with_capacity(n_cells, shape[1]);
+    let traces_ref = traces.as_array();
+
+    for cell_idx in 0..n_cells {
+        let row = traces_ref.row(cell_idx);
+        let slice = row
+            .as_slice()
+            .ok_or_else(|| pyo3::exceptions::PyValueError::new_err(CONTIGUOUS_ERR))?;
+        if let Some(i) = crate::first_nonfinite(slice) {
+            return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                "{NONFINITE_ERR} at row {cell_idx}, index {i}"
+            )));
+        }
+        solve_one(&mut solver, slice, filter_enabled, max_iters);
+        results.push_from_solver(&mut solver);
     }
 
-    Ok((
-        activities,
-        baselines,
-        reconvolutions,
-        iterations,
-        convergeds,
-    ))
+    Ok(results.into_tuple(py, n_cells))
 }
 
 /// Run peak-seeded spike detection on a single trace.
@@ -663,7 +814,9 @@ fn _solver(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(py_build_kernel, m)?)?;
     m.add_function(wrap_pyfunction!(py_compute_lipschitz, m)?)?;
     m.add_function(wrap_pyfunction!(deconvolve_single, m)?)?;
+    m.add_function(wrap_pyfunction!(deconvolve_single_f32, m)?)?;
     m.add_function(wrap_pyfunction!(deconvolve_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(deconvolve_batch_f32, m)?)?;
     m.add_function(wrap_pyfunction!(py_seed_trace, m)?)?;
     m.add_function(wrap_pyfunction!(seed_kernel_estimate, m)?)?;
     // InDeCa pipeline
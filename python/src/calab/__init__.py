@@ -1,88 +1,116 @@
 """CaLab: calcium imaging analysis tools — deconvolution and data preparation."""
 
-from ._bridge import DeconConfig, HeadlessBrowser, decon, tune
-from ._compute import (
-    BiexpFitResult,
-    CaDeconResult,
-    DeconvolutionResult,
-    SolveTraceResult,
-    bandpass_filter,
-    build_kernel,
-    compute_lipschitz,
-    compute_upsample_factor,
-    estimate_kernel,
-    fit_biexponential,
-    run_deconvolution,
-    run_deconvolution_full,
-    solve_trace,
-    tau_to_ar2,
-)
-from ._io import deconvolve_from_export, load_export_params, load_tuning_data, save_for_tuning
-from ._loaders import load_caiman, load_minian
-from ._simulate import (
-    CellGroundTruth,
-    DriftModel,
-    KernelConfig,
-    MarkovConfig,
-    NoiseConfig,
-    PhotobleachingConfig,
-    PoissonConfig,
-    RandomWalkDrift,
-    SaturationConfig,
-    SimulationConfig,
-    SimulationResult,
-    SinusoidalDrift,
-    SpikeModel,
-    presets,
-    simulate,
-)
+from __future__ import annotations
 
+from importlib import import_module
 from importlib.metadata import version as _pkg_version
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._bridge import DeconConfig, HeadlessBrowser, decon, tune
+    from ._compute import (
+        BiexpFitResult,
+        CaDeconResult,
+        DeconvolutionResult,
+        SolveTraceResult,
+        bandpass_filter,
+        build_kernel,
+        build_kernel_batch,
+        compute_lipschitz,
+        compute_upsample_factor,
+        estimate_kernel,
+        fit_biexponential,
+        run_deconvolution,
+        run_deconvolution_full,
+        solve_trace,
+        tau_to_ar2,
+    )
+    from ._io import deconvolve_from_export, load_export_params, load_tuning_data, save_for_tuning
+    from ._loaders import load_caiman, load_minian
+    from ._simulate import (
+        CellGroundTruth,
+        DriftModel,
+        KernelConfig,
+        MarkovConfig,
+        NoiseConfig,
+        PhotobleachingConfig,
+        PoissonConfig,
+        RandomWalkDrift,
+        SaturationConfig,
+        SimulationConfig,
+        SimulationResult,
+        SinusoidalDrift,
+        SpikeModel,
+        presets,
+        simulate,
+    )
 
 __version__ = _pkg_version("calab")
-__all__ = [
+
+# PEP 562 lazy re-exports: `import calab` stays cheap (no native solver,
+# pydantic, or simulation stack) until a symbol is actually touched.
+# Keeps CLI startup for `calab info`/`--version` to milliseconds.
+_ATTR_TO_SUBMODULE = {
     # Bridge
-    "DeconConfig",
-    "HeadlessBrowser",
-    "decon",
-    "tune",
+    "DeconConfig": "_bridge",
+    "HeadlessBrowser": "_bridge",
+    "decon": "_bridge",
+    "tune": "_bridge",
     # Compute
-    "BiexpFitResult",
-    "CaDeconResult",
-    "DeconvolutionResult",
-    "SolveTraceResult",
-    "bandpass_filter",
-    "build_kernel",
-    "compute_lipschitz",
-    "compute_upsample_factor",
-    "estimate_kernel",
-    "fit_biexponential",
-    "run_deconvolution",
-    "run_deconvolution_full",
-    "solve_trace",
-    "tau_to_ar2",
+    "BiexpFitResult": "_compute",
+    "CaDeconResult": "_compute",
+    "DeconvolutionResult": "_compute",
+    "SolveTraceResult": "_compute",
+    "bandpass_filter": "_compute",
+    "build_kernel": "_compute",
+    "build_kernel_batch": "_compute",
+    "compute_lipschitz": "_compute",
+    "compute_upsample_factor": "_compute",
+    "estimate_kernel": "_compute",
+    "fit_biexponential": "_compute",
+    "run_deconvolution": "_compute",
+    "run_deconvolution_full": "_compute",
+    "solve_trace": "_compute",
+    "tau_to_ar2": "_compute",
     # I/O
-    "deconvolve_from_export",
-    "load_export_params",
-    "load_tuning_data",
-    "save_for_tuning",
+    "deconvolve_from_export": "_io",
+    "load_export_params": "_io",
+    "load_tuning_data": "_io",
+    "save_for_tuning": "_io",
     # Loaders
-    "load_caiman",
-    "load_minian",
+    "load_caiman": "_loaders",
+    "load_minian": "_loaders",
     # Simulation
-    "CellGroundTruth",
-    "DriftModel",
-    "KernelConfig",
-    "MarkovConfig",
-    "NoiseConfig",
-    "PhotobleachingConfig",
-    "PoissonConfig",
-    "RandomWalkDrift",
-    "SaturationConfig",
-    "SimulationConfig",
-    "SimulationResult",
-    "SinusoidalDrift",
-    "SpikeModel",
-    "presets",
-    "simulate",
-]
+    "CellGroundTruth": "_simulate",
+    "DriftModel": "_simulate",
+    "KernelConfig": "_simulate",
+    "MarkovConfig": "_simulate",
+    "NoiseConfig": "_simulate",
+    "PhotobleachingConfig": "_simulate",
+    "PoissonConfig": "_simulate",
+    "RandomWalkDrift": "_simulate",
+    "SaturationConfig": "_simulate",
+    "SimulationConfig": "_simulate",
+    "SimulationResult": "_simulate",
+    "SinusoidalDrift": "_simulate",
+    "SpikeModel": "_simulate",
+    "presets": "_simulate",
+    "simulate": "_simulate",
+}
+
+__all__ = list(_ATTR_TO_SUBMODULE)
+
+
+def __getattr__(name: str) -> object:
+    try:
+        submodule = _ATTR_TO_SUBMODULE[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{submodule}", __name__), name)
+    # Cache on the package so subsequent lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -13,12 +13,12 @@ import numpy as np
 
 from ._headless import HeadlessBrowser
 from ._models import DeconConfig
-from ._server import BridgeServer
+from ._server import HEARTBEAT_TIMEOUT, BridgeServer  # noqa: F401 — HEARTBEAT_TIMEOUT re-exported
 
 if TYPE_CHECKING:
-    from .._compute import CaDeconResult
+    from collections.abc import Callable
 
-HEARTBEAT_TIMEOUT = 10  # seconds without heartbeat = browser disconnected
+    from .._compute import CaDeconResult
 
 # Kernel waveforms are truncated to this many decay time-constants
 # (kernel_length = KERNEL_LENGTH_DECAY_MULTIPLES * tau_decay * fs). Five decay
@@ -73,7 +73,8 @@ def _managed_headless(headless: HeadlessBrowser | bool | None):
 
 def _run_bridge(
     server: BridgeServer,
-    event: threading.Event,
+    ready: Callable[[], bool],
+    wait: Callable[[float | None], bool],
     app_name: str,
     app_url: str,
     open_browser: bool,
@@ -81,9 +82,14 @@ def _run_bridge(
     show_progress: bool = False,
     headless: HeadlessBrowser | None = None,
 ) -> bool:
-    """Start server, open browser, and wait for the bridge event.
-
-    Returns True if the event fired (data received), False otherwise.
+    """Start server, open browser, and wait for the bridge rendezvous.
+
+    ``wait`` is one of the server's public blocking helpers
+    (``server.wait_for_params`` / ``server.wait_for_results``) and does
+    the waiting when no progress display is needed. ``ready`` is the
+    matching flag check (e.g. ``lambda: server.params_ready``),
+    evaluated under the server's condition variable by the progress
+    loop. Returns True if the data was received, False otherwise.
     """
     actual_port = server.port
     server_thread = threading.Thread(target=server.serve_forever, daemon=True)
@@ -100,34 +106,49 @@ def _run_bridge(
     elif open_browser:
         webbrowser.open(full_url)
 
+    # Event-driven wait on the server's condition variable: handlers
+    # notify it when params/results arrive and the heartbeat watchdog
+    # notifies it on disconnect, so one wait covers both with no
+    # periodic staleness polling. The progress display, when enabled,
+    # still ticks at 1 Hz because redrawing the terminal line is
+    # inherently periodic.
     received = False
-    start_time = time.monotonic()
+    disconnected = False
+    # Absolute deadline computed once; the display loop then needs a
+    # single monotonic read per tick instead of re-deriving elapsed time.
+    deadline = None if timeout is None else time.monotonic() + timeout
     last_progress_id: object = None
     try:
-        while True:
-            if event.wait(timeout=1.0):
-                received = True
-                break
-
-            now = time.monotonic()
-
-            # Display progress updates in terminal
-            if show_progress and server.latest_progress is not None:
-                prog = server.latest_progress
-                prog_id = (prog.get("iteration"), prog.get("phase_progress"), prog.get("status"))
-                if prog_id != last_progress_id:
-                    last_progress_id = prog_id
-                    line = _format_progress(prog)
-                    sys.stdout.write(f"\r\033[K{line}")
-                    sys.stdout.flush()
-
-            if timeout is not None and (now - start_time) >= timeout:
-                break
-
-            if server.last_heartbeat is not None:
-                if (now - server.last_heartbeat) > HEARTBEAT_TIMEOUT:
-                    print("\nBrowser disconnected (heartbeat timeout).")
-                    break
+        if show_progress:
+            # The 1 Hz redraw loop has to hold the condition variable
+            # across its wake-check-redraw cycle, and the lock is not
+            # reentrant — so this branch cannot go through the public
+            # wait helpers and keeps the raw wait.
+            with server._cv:
+                while not (ready() or server.disconnected):
+                    server._cv.wait(timeout=1.0)
+
+                    # Display progress updates in terminal
+                    if server.latest_progress is not None:
+                        prog = server.latest_progress
+                        prog_id = (
+                            prog.get("iteration"), prog.get("phase_progress"), prog.get("status"),
+                        )
+                        if prog_id != last_progress_id:
+                            last_progress_id = prog_id
+                            line = _format_progress(prog)
+                            sys.stdout.write(f"\r\033[K{line}")
+                            sys.stdout.flush()
+
+                    if deadline is not None and time.monotonic() >= deadline:
+                        break
+                received = ready()
+        else:
+            received = wait(timeout)
+        disconnected = server.disconnected
+
+        if disconnected and not received:
+            print("\nBrowser disconnected (heartbeat timeout).")
     except KeyboardInterrupt:
         print("\nBridge cancelled by user.")
     finally:
@@ -135,6 +156,11 @@ def _run_bridge(
             sys.stdout.write("\n")
             sys.stdout.flush()
         server.shutdown()
+        # shutdown() only stops the accept loop; server_close() releases
+        # the listening socket, the self-pipe fds, and the spooled
+        # traces file — without it every session leaks a recording-sized
+        # temp file.
+        server.server_close()
 
     return received
 
@@ -146,6 +172,7 @@ def tune(
     port: int | None = None,
     app_url: str | None = None,
     open_browser: bool = True,
+    dtype: str = "float32",
 ) -> dict | None:
     """Open CaTune in the browser for interactive parameter tuning.
 
@@ -167,6 +194,10 @@ def tune(
         Override CaTune URL (for local dev). Default: GitHub Pages.
     open_browser : bool
         Whether to auto-open the browser. Default: True.
+    dtype : str
+        Dtype the traces are served as. Default ``"float32"`` halves
+        bandwidth vs float64 with no visible effect on tuning; pass
+        ``"float64"`` to keep full precision on the wire.
 
     Returns
     -------
@@ -174,9 +205,9 @@ def tune(
         Exported parameters dict if received, None if timeout/cancelled.
         Keys: ``tau_rise``, ``tau_decay``, ``lambda_``, ``fs``, ``filter_enabled``.
     """
-    server = BridgeServer(traces, fs, port=port or 0)
+    server = BridgeServer(traces, fs, port=port or 0, dtype=dtype)
     received = _run_bridge(
-        server, server.params_event, "CaTune",
+        server, lambda: server.params_ready, server.wait_for_params, "CaTune",
         app_url or _DEFAULT_CATUNE_URL, open_browser, timeout,
     )
 
@@ -285,7 +316,7 @@ def decon(
     server = BridgeServer(traces, fs, port=port or 0, app="cadecon", config=config_dict)
     with _managed_headless(headless) as headless_browser:
         received = _run_bridge(
-            server, server.results_event, "CaDecon",
+            server, lambda: server.results_ready, server.wait_for_results, "CaDecon",
             app_url or _DEFAULT_CADECON_URL, open_browser, timeout,
             show_progress=autorun,
             headless=headless_browser,
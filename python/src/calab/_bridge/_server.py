@@ -11,26 +11,104 @@ server without needing ``--disable-web-security`` on the browser.
 
 from __future__ import annotations
 
+import gzip
 import hmac
 import io
 import json
+import os
 import secrets
+import selectors
+import socket
+import tempfile
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 
 import numpy as np
 
+try:
+    # Optional accelerator: orjson encodes straight to bytes, several
+    # times faster than json.dumps + str.encode. Stdlib fallback below.
+    import orjson
+except ImportError:
+    orjson = None
+
+# Seconds without a heartbeat before the browser is considered
+# disconnected. Every heartbeat POST re-arms a watchdog timer; if the
+# timer fires, the server's ``disconnected`` event is set.
+HEARTBEAT_TIMEOUT = 10
+
+# Block size for streaming large payloads through wfile. ~1 MiB
+# amortizes per-write syscall cost without handing the socket layer one
+# giant buffer to copy in a single shot.
+_WRITE_BLOCK = 1 << 20
+
+
+def _prepare_traces(traces: np.ndarray, dtype: str | None) -> np.ndarray:
+    """Coerce traces to a C-contiguous 2-D float array.
+
+    Fast path: a 2-D float32/float64 C-contiguous ndarray (the common
+    ``tune(traces, ...)`` case) is returned as-is, with no copy — peak
+    memory stays at 1× trace size instead of 2×. Everything else goes
+    through the general coercion path. Non-float inputs become float32;
+    an explicit ``dtype`` overrides.
+    """
+    target = None if dtype is None else np.dtype(dtype)
+    if (
+        isinstance(traces, np.ndarray)
+        and traces.ndim == 2
+        and traces.flags.c_contiguous
+        and (traces.dtype == target if target is not None
+             else traces.dtype in (np.float32, np.float64))
+    ):
+        return traces
+    arr = np.ascontiguousarray(np.atleast_2d(traces))
+    if target is not None:
+        arr = np.ascontiguousarray(arr, dtype=target)
+    elif arr.dtype not in (np.float32, np.float64):
+        arr = arr.astype(np.float32)
+    return arr
+
 
 class BridgeHandler(BaseHTTPRequestHandler):
     """HTTP handler for the bridge server."""
 
     server: BridgeServer
 
+    # HTTP/1.1 keep-alive: CaTune issues /status, /metadata, /traces and
+    # then a steady stream of heartbeats — one persistent connection
+    # carries them all instead of a TCP handshake per request. Safe
+    # because every response sets Content-Length.
+    protocol_version = "HTTP/1.1"
+
+    # Heartbeat acks are tiny; Nagle would hold them back waiting for a
+    # full segment. BaseHTTPRequestHandler reads this in setup() and
+    # sets TCP_NODELAY on the accepted socket.
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        super().setup()
+        # Keep-alive probes so a connection abandoned by a crashed
+        # browser is eventually torn down instead of lingering.
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
     def log_message(self, format: str, *args: Any) -> None:
         """Suppress default stderr logging."""
 
+    # The 200-with-CORS header block never changes between requests, so
+    # it is frozen to bytes once at class level. _send_cors_response
+    # assembles status line + headers + body into a single buffer and
+    # writes it in one call — one syscall per response instead of one
+    # per header, which matters on the heartbeat hot path.
+    _CORS_RESPONSE_HEAD = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Access-Control-Allow-Origin: *\r\n"
+        b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+        b"Access-Control-Allow-Headers: Content-Type, X-Bridge-Secret\r\n"
+        b"Connection: keep-alive\r\n"
+    )
+
     def _cors_headers(self) -> dict[str, str]:
         """Headers common to every CORS response."""
         return {
@@ -43,17 +121,21 @@ class BridgeHandler(BaseHTTPRequestHandler):
         self, data: bytes, content_type: str = "application/json",
     ) -> None:
         """Send a 200 response with CORS headers and body."""
-        self.send_response(200)
-        for k, v in self._cors_headers().items():
-            self.send_header(k, v)
-        self.send_header("Content-Type", content_type)
-        self.send_header("Content-Length", str(len(data)))
-        self.end_headers()
-        self.wfile.write(data)
+        self.wfile.write(
+            self._CORS_RESPONSE_HEAD
+            + b"Content-Type: " + content_type.encode("latin-1")
+            + b"\r\nContent-Length: " + str(len(data)).encode("ascii")
+            + b"\r\n\r\n"
+            + data
+        )
 
     def _send_json(self, obj: Any) -> None:
         """Send a JSON-serializable object as a CORS response."""
-        self._send_cors_response(json.dumps(obj).encode())
+        if orjson is not None:
+            data = orjson.dumps(obj)
+        else:
+            data = json.dumps(obj, separators=(",", ":")).encode()
+        self._send_cors_response(data)
 
     def _send_error_cors(self, code: int, message: str) -> None:
         """Send an error response with CORS headers."""
@@ -114,7 +196,7 @@ class BridgeHandler(BaseHTTPRequestHandler):
         elif self.path == "/api/v1/config":
             self._send_json(self.server.config)
         elif self.path == "/api/v1/status":
-            self._send_json({"ready": True, "app": self.server.app})
+            self._send_cors_response(self.server._status_bytes)
         elif self.path == "/api/v1/health":
             self._send_cors_response(b"ok", content_type="text/plain")
         else:
@@ -127,7 +209,8 @@ class BridgeHandler(BaseHTTPRequestHandler):
             self._receive_params()
         elif self.path == "/api/v1/heartbeat":
             self.server.last_heartbeat = time.monotonic()
-            self._send_json({"status": "ok"})
+            self.server._arm_heartbeat_watchdog()
+            self._send_cors_response(self.server._ok_bytes)
         elif self.path == "/api/v1/progress":
             self._receive_progress()
         elif self.path == "/api/v1/results/activity":
@@ -138,18 +221,57 @@ class BridgeHandler(BaseHTTPRequestHandler):
             self.send_error(404, "Not Found")
 
     def _serve_traces(self) -> None:
-        """Serve traces as .npy binary."""
-        buf = io.BytesIO()
-        np.save(buf, self.server.traces)
-        self._send_cors_response(buf.getvalue(), content_type="application/octet-stream")
+        """Serve the pre-serialized traces .npy payload.
+
+        Streams the spooled payload file with ``socket.sendfile`` so the
+        kernel moves the bytes to the TCP stack directly instead of
+        walking the whole buffer through Python's write path. Falls back
+        to the cached in-memory bytes if the file can't be opened. When
+        the client accepts gzip, the pre-compressed cached variant is
+        sent instead — a big win on bandwidth-limited tunnels.
+        """
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            payload = self.server._traces_npy_gz
+            self.send_response(200)
+            for k, v in self._cors_headers().items():
+                self.send_header(k, v)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self._write_blocks(payload)
+            return
+        payload = self.server._traces_npy
+        self.send_response(200)
+        for k, v in self._cors_headers().items():
+            self.send_header(k, v)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        try:
+            fp = open(self.server._traces_path, "rb")
+        except OSError:
+            self._write_blocks(payload)
+            return
+        with fp:
+            self.wfile.flush()
+            self.connection.sendfile(fp, count=len(payload))
+
+    def _write_blocks(self, data: bytes) -> None:
+        """Write a large payload in ``_WRITE_BLOCK``-sized slices.
+
+        Slicing a memoryview streams the payload without materializing
+        intermediate copies, so the client can start parsing while the
+        tail is still in flight.
+        """
+        mv = memoryview(data)
+        for off in range(0, len(mv), _WRITE_BLOCK):
+            self.wfile.write(mv[off:off + _WRITE_BLOCK])
+        self.wfile.flush()
 
     def _serve_metadata(self) -> None:
-        """Serve metadata as JSON."""
-        self._send_json({
-            "sampling_rate_hz": self.server.fs,
-            "num_cells": int(self.server.traces.shape[0]),
-            "num_timepoints": int(self.server.traces.shape[1]),
-        })
+        """Serve the pre-encoded metadata JSON."""
+        self._send_cors_response(self.server._metadata_bytes)
 
     def _receive_params(self) -> None:
         """Receive exported params JSON from web app."""
@@ -162,9 +284,11 @@ class BridgeHandler(BaseHTTPRequestHandler):
             self._send_error_cors(400, "Invalid JSON")
             return
 
-        self.server.received_params = params
-        self.server.params_event.set()
-        self._send_json({"status": "ok"})
+        with self.server._cv:
+            self.server.received_params = params
+            self.server.params_ready = True
+            self.server._cv.notify_all()
+        self._send_cors_response(self.server._ok_bytes)
 
     def _receive_progress(self) -> None:
         """Receive a progress update from the browser."""
@@ -178,7 +302,7 @@ class BridgeHandler(BaseHTTPRequestHandler):
             return
 
         self.server.latest_progress = progress
-        self._send_json({"status": "ok"})
+        self._send_cors_response(self.server._ok_bytes)
 
     def _receive_results_activity(self) -> None:
         """Receive activity matrix as .npy binary from CaDecon."""
@@ -192,7 +316,7 @@ class BridgeHandler(BaseHTTPRequestHandler):
             return
 
         self.server.received_activity = arr
-        self._send_json({"status": "ok"})
+        self._send_cors_response(self.server._ok_bytes)
 
     def _receive_results(self) -> None:
         """Receive CaDecon results JSON (scalars + metadata). Triggers completion event."""
@@ -205,13 +329,26 @@ class BridgeHandler(BaseHTTPRequestHandler):
             self._send_error_cors(400, "Invalid JSON")
             return
 
-        self.server.received_results = results
-        self.server.results_event.set()
-        self._send_json({"status": "ok"})
+        with self.server._cv:
+            self.server.received_results = results
+            self.server.results_ready = True
+            self.server._cv.notify_all()
+        self._send_cors_response(self.server._ok_bytes)
+
 
+class BridgeServer(ThreadingHTTPServer):
+    """HTTP server that holds trace data and waits for params/results.
 
-class BridgeServer(HTTPServer):
-    """HTTP server that holds trace data and waits for params/results."""
+    Threaded so a slow /traces transfer never blocks heartbeats or the
+    params/results POST on other connections.
+    """
+
+    daemon_threads = True
+    # CaTune opens a burst of connections on load (status, metadata,
+    # traces, heartbeats); the stdlib backlog of 5 can drop SYNs on a
+    # rapid reconnect. 128 is cheap and removes that stall.
+    request_queue_size = 128
+    allow_reuse_address = True
 
     def __init__(
         self,
@@ -221,28 +358,162 @@ class BridgeServer(HTTPServer):
         app: str = "catune",
         config: dict | None = None,
         secret: str | None = None,
+        dtype: str | None = None,
+        heartbeat_timeout: float = HEARTBEAT_TIMEOUT,
     ) -> None:
-        self.traces = np.atleast_2d(np.asarray(traces, dtype=np.float64))
+        # Preserve the caller's float dtype rather than upcasting to
+        # float64 — float32 is the common miniscope case and upcasting
+        # doubles both the cached payload and the bytes on the wire.
+        # CaTune reads the dtype from the .npy header, so any float
+        # width round-trips.
+        self.traces = _prepare_traces(traces, dtype)
+        # Serialize the traces once; every /api/v1/traces hit serves these
+        # cached bytes instead of re-encoding the full array per request.
+        buf = io.BytesIO()
+        np.save(buf, self.traces)
+        self._traces_npy: bytes = buf.getvalue()
+        # Gzip variant for bandwidth-limited sockets (e.g. "localhost"
+        # tunnelled through a remote-dev forwarder). Calcium traces are
+        # low-entropy, so even level 1 — the fast setting — typically
+        # halves the payload. Served when the client accepts gzip.
+        self._traces_npy_gz: bytes = gzip.compress(self._traces_npy, compresslevel=1)
+        # Spool the payload to a temp file too: /api/v1/traces streams it
+        # via socket.sendfile (kernel zero-copy), which beats pushing a
+        # multi-hundred-MB bytes object through wfile.write. Each request
+        # opens its own fd so concurrent fetches never share a file
+        # position. Removed in server_close().
+        with tempfile.NamedTemporaryFile(
+            prefix="calab-traces-", suffix=".npy", delete=False,
+        ) as fp:
+            fp.write(self._traces_npy)
+        self._traces_path: str = fp.name
         self.fs = fs
         self.app = app
+        # Hot-path response bodies are frozen at construction; cache the
+        # encoded bytes so /metadata, /status, and the heartbeat/receipt
+        # acks are a header write plus memcpy instead of a json.dumps.
+        self._metadata_bytes: bytes = json.dumps({
+            "sampling_rate_hz": fs,
+            "num_cells": int(self.traces.shape[0]),
+            "num_timepoints": int(self.traces.shape[1]),
+        }).encode()
+        self._status_bytes: bytes = json.dumps({"ready": True, "app": app}).encode()
+        self._ok_bytes: bytes = json.dumps({"status": "ok"}).encode()
         self.config: dict = config if config is not None else {"autorun": False}
         self.latest_progress: dict | None = None
         self.received_params: dict | None = None
-        self.params_event = threading.Event()
         self.last_heartbeat: float | None = None
+        # One-shot rendezvous: a single condition variable guards the
+        # ready/disconnect flags, so a waiter can block on the combined
+        # predicate (params_ready or disconnected) in one wait instead
+        # of juggling per-signal Event objects.
+        self._cv = threading.Condition()
+        self.params_ready = False
+        self.results_ready = False
+        self.disconnected = False
+        # Disconnect detection: each heartbeat re-arms a watchdog timer;
+        # if heartbeats stop for heartbeat_timeout seconds, the timer
+        # fires and flags ``disconnected`` so waiters wake immediately
+        # instead of polling for staleness.
+        self.heartbeat_timeout = heartbeat_timeout
+        self._watchdog: threading.Timer | None = None
+        self._watchdog_lock = threading.Lock()
         # CaDecon results (two-POST pattern)
         self.received_activity: np.ndarray | None = None
         self.received_results: dict | None = None
-        self.results_event = threading.Event()
         # Per-run secret. Each BridgeServer gets a fresh 32-byte token that
         # the opened URL passes to the browser via ?bridge_secret=...; every
         # bridge HTTP request must echo it back in the X-Bridge-Secret
         # header. Prevents other tabs/processes on the same machine from
         # reading the served trace data or spoofing results.
         self.secret: str = secret if secret is not None else secrets.token_hex(32)
+        # Self-pipe for event-driven shutdown: serve_forever blocks in
+        # select on (listening socket, pipe read end) and shutdown()
+        # writes one byte — no 0.5 s stdlib poll loop burning wakeups
+        # while idle, and shutdown returns as soon as the loop exits.
+        self._shutdown_rd, self._shutdown_wr = socket.socketpair()
+        self._serve_done = threading.Event()
+        self._serve_done.set()
 
         super().__init__(("127.0.0.1", port), BridgeHandler)
 
     @property
     def port(self) -> int:
         return self.server_address[1]
+
+    def _arm_heartbeat_watchdog(self) -> None:
+        """(Re)start the disconnect watchdog after a heartbeat arrived."""
+        with self._watchdog_lock:
+            if self._watchdog is not None:
+                self._watchdog.cancel()
+            self._watchdog = threading.Timer(self.heartbeat_timeout, self._on_heartbeat_lost)
+            self._watchdog.daemon = True
+            self._watchdog.start()
+
+    def _on_heartbeat_lost(self) -> None:
+        """Watchdog callback: flag the browser as disconnected."""
+        with self._cv:
+            self.disconnected = True
+            self._cv.notify_all()
+
+    def wait_for_params(self, timeout: float | None = None) -> bool:
+        """Block until CaTune params arrive, the browser disconnects, or timeout.
+
+        Returns True when params were received.
+        """
+        with self._cv:
+            self._cv.wait_for(lambda: self.params_ready or self.disconnected, timeout)
+            return self.params_ready
+
+    def wait_for_results(self, timeout: float | None = None) -> bool:
+        """Block until CaDecon results arrive, the browser disconnects, or timeout.
+
+        Returns True when results were received.
+        """
+        with self._cv:
+            self._cv.wait_for(lambda: self.results_ready or self.disconnected, timeout)
+            return self.results_ready
+
+    def serve_forever(self, poll_interval: float | None = None) -> None:
+        """Accept requests until :meth:`shutdown`, without periodic polling.
+
+        ``poll_interval`` is accepted for signature compatibility and
+        ignored — the loop blocks in ``select`` until the listening
+        socket or the shutdown self-pipe becomes readable.
+        """
+        self._serve_done.clear()
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(self, selectors.EVENT_READ)
+                selector.register(self._shutdown_rd, selectors.EVENT_READ)
+                while True:
+                    for key, _ in selector.select():
+                        if key.fileobj is self._shutdown_rd:
+                            self._shutdown_rd.recv(1)
+                            return
+                        self._handle_request_noblock()
+                    self.service_actions()
+        finally:
+            self._serve_done.set()
+
+    def shutdown(self) -> None:
+        """Stop :meth:`serve_forever` and wait for it to exit."""
+        try:
+            self._shutdown_wr.send(b"\x00")
+        except OSError:
+            return  # self-pipe already closed by server_close
+        self._serve_done.wait()
+
+    def server_close(self) -> None:
+        """Close the listening socket and remove the spooled payload file."""
+        with self._watchdog_lock:
+            if self._watchdog is not None:
+                self._watchdog.cancel()
+                self._watchdog = None
+        super().server_close()
+        self._shutdown_rd.close()
+        self._shutdown_wr.close()
+        try:
+            os.unlink(self._traces_path)
+        except OSError:
+            pass
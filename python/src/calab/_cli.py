@@ -26,7 +26,10 @@ def cmd_tune(args: argparse.Namespace) -> None:
     ext = Path(path).suffix.lower()
 
     if ext == ".npy":
-        traces = np.load(path)
+        # Memory-map: pages are faulted in on demand when the bridge
+        # server builds its payload cache, instead of slurping the whole
+        # file (and holding two copies) before the server even starts.
+        traces = np.load(path, mmap_mode="r")
         if traces.ndim == 1:
             traces = traces.reshape(1, -1)
     else:
@@ -48,16 +51,11 @@ def cmd_tune(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
-def _to_serializable(value):
-    """Convert numpy arrays/scalars to JSON-serializable Python types."""
-    return value.tolist() if hasattr(value, "tolist") else value
-
-
 def cmd_cadecon(args: argparse.Namespace) -> None:
     """Open CaDecon for automated deconvolution."""
     from ._bridge import decon
 
-    traces = np.load(args.file)
+    traces = np.load(args.file, mmap_mode="r")
     if traces.ndim == 1:
         traces = traces.reshape(1, -1)
 
@@ -104,18 +102,23 @@ def cmd_deconvolve(args: argparse.Namespace) -> None:
     from ._compute import bandpass_filter, run_deconvolution, run_deconvolution_full
     from ._io import load_export_params
 
-    traces = np.load(args.file)
+    # Memory-mapped read-only view; the filter/deconvolution paths copy
+    # into their own working dtype, so nothing needs the array writable.
+    traces = np.load(args.file, mmap_mode="r")
     if traces.ndim == 1:
         traces = traces.reshape(1, -1)
 
     params = load_export_params(args.params)
 
     if params["filter_enabled"]:
-        traces = traces.copy()
-        for i in range(traces.shape[0]):
-            traces[i] = bandpass_filter(
-                traces[i], params["tau_rise"], params["tau_decay"], params["fs"],
-            )
+        # Preallocate the destination and filter into it — the memmapped
+        # input stays untouched and no intermediate copy is made.
+        filtered = np.empty(traces.shape)
+        bandpass_filter(
+            traces, params["tau_rise"], params["tau_decay"], params["fs"],
+            out=filtered,
+        )
+        traces = filtered
 
     deconv_kwargs = dict(
         fs=params["fs"],
@@ -128,14 +131,21 @@ def cmd_deconvolve(args: argparse.Namespace) -> None:
         result = run_deconvolution_full(traces, **deconv_kwargs)
         np.save(args.output, result.activity)
 
-        info_path = str(Path(args.output).with_suffix("")) + "_info.json"
-        info = {
-            "baseline": _to_serializable(result.baseline),
-            "iterations": _to_serializable(result.iterations),
-            "converged": _to_serializable(result.converged),
-        }
-        with open(info_path, "w") as f:
-            json.dump(info, f, indent=2)
+        # Per-cell arrays go to a binary .npz sidecar: tolist() +
+        # json.dump builds a Python object per element, which is slow
+        # and bloated for thousands of cells. Scalars stay in a small
+        # JSON for human inspection.
+        stem = str(Path(args.output).with_suffix(""))
+        info_path = f"{stem}_info.npz"
+        np.savez(
+            info_path,
+            baseline=result.baseline,
+            iterations=result.iterations,
+            converged=result.converged,
+        )
+        meta_path = f"{stem}_info.json"
+        with open(meta_path, "w") as f:
+            json.dump(deconv_kwargs, f, indent=2)
         print(f"Saved activity to {args.output}")
         print(f"Saved info to {info_path}")
     else:
@@ -170,11 +180,13 @@ def cmd_convert(args: argparse.Namespace) -> None:
 
 def cmd_info(args: argparse.Namespace) -> None:
     """Show file info."""
+    from ._io import _fast_json_load
+
     path = args.file
     ext = Path(path).suffix.lower()
 
     if ext == ".npy":
-        data = np.load(path)
+        data = np.load(path, mmap_mode="r")  # header-only; no data read
         print(f"File: {path}")
         print(f"  Shape: {data.shape}")
         print(f"  Dtype: {data.dtype}")
@@ -186,8 +198,8 @@ def cmd_info(args: argparse.Namespace) -> None:
         stem = str(Path(path).with_suffix(""))
         meta_path = f"{stem}_metadata.json"
         if Path(meta_path).exists():
-            with open(meta_path) as f:
-                meta = json.load(f)
+            with open(meta_path, "rb") as f:
+                meta = _fast_json_load(f)
             print(f"  Metadata: {meta_path}")
             if "sampling_rate_hz" in meta:
                 print(f"  Sampling rate: {meta['sampling_rate_hz']} Hz")
@@ -195,8 +207,8 @@ def cmd_info(args: argparse.Namespace) -> None:
                 print(f"  Schema: v{meta['schema_version']}")
 
     elif ext == ".json":
-        with open(path) as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = _fast_json_load(f)
         print(f"File: {path}")
         if "parameters" in data:
             params = data["parameters"]
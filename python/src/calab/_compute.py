@@ -6,6 +6,9 @@ build_kernel, etc.) but delegates to the native Rust solver via calab._solver.
 
 from __future__ import annotations
 
+import math
+import threading
+from functools import lru_cache
 from typing import NamedTuple
 
 import numpy as np
@@ -13,7 +16,7 @@ import numpy as np
 from ._solver import (
     PySolver,
     deconvolve_batch as _deconvolve_batch,
-    deconvolve_single as _deconvolve_single,
+    deconvolve_batch_f32 as _deconvolve_batch_f32,
     py_build_kernel as _build_kernel,
     py_compute_lipschitz as _compute_lipschitz,
     py_indeca_solve_trace as _indeca_solve_trace,
@@ -62,9 +65,18 @@ def _build_biexp_waveform(
     """Build a biexponential waveform: beta * (exp(-t/tau_d) - exp(-t/tau_r)).
 
     Uses the same 5x tau_decay length convention as the browser solver.
+
+    Built with in-place ops on two buffers (exponent and waveform)
+    instead of the naive expression, which would allocate a fresh
+    full-length temporary per step.
     """
-    t = np.arange(length) / fs
-    waveform = beta * (np.exp(-t / tau_decay) - np.exp(-t / tau_rise))
+    t = np.arange(length, dtype=np.float64)
+    t *= -1.0 / (fs * tau_decay)
+    waveform = np.exp(t)  # slow component: exp(-t/tau_decay)
+    t *= tau_decay / tau_rise  # rescale exponent for the fast component
+    np.exp(t, out=t)
+    waveform -= t
+    waveform *= beta
     return waveform.astype(np.float32)
 
 
@@ -94,20 +106,80 @@ class DeconvolutionResult(NamedTuple):
 
 def build_kernel(tau_rise: float, tau_decay: float, fs: float) -> np.ndarray:
     """Build double-exponential calcium kernel. Delegates to Rust."""
-    return np.asarray(_build_kernel(tau_rise, tau_decay, fs))
+    # The binding already returns a numpy float32 array; no wrap needed.
+    return _build_kernel(tau_rise, tau_decay, fs)
 
 
-def compute_lipschitz(kernel: np.ndarray) -> float:
-    """Compute Lipschitz constant. Delegates to Rust."""
-    return _compute_lipschitz(np.ascontiguousarray(kernel, dtype=np.float32))
+def build_kernel_batch(
+    tau_rises: np.ndarray, tau_decays: np.ndarray, fs: float,
+) -> list[np.ndarray]:
+    """Build kernels for many (tau_rise, tau_decay) pairs in one shot.
+
+    Parameter sweeps call :func:`build_kernel` once per pair; this
+    evaluates the whole sweep as a single broadcast expression (two
+    ``np.exp`` calls over a ``(B, max_len)`` grid) instead of B separate
+    calls. Inputs broadcast against each other, so a scalar ``tau_rise``
+    can be swept against a vector of decays.
+
+    Parameters
+    ----------
+    tau_rises, tau_decays : array_like
+        Time constants in seconds; broadcast to a common shape.
+    fs : float
+        Sampling rate in Hz.
+
+    Returns
+    -------
+    list[np.ndarray]
+        One float32 kernel per pair, each truncated to its own length
+        (until the decay envelope drops below 1e-6 of peak, minimum 2
+        samples) and normalized to peak 1.0 — matching
+        :func:`build_kernel` row by row.
+    """
+    tr, td = np.broadcast_arrays(
+        np.asarray(tau_rises, dtype=np.float64),
+        np.asarray(tau_decays, dtype=np.float64),
+    )
+    tr = tr.ravel()
+    td = td.ravel()
+    # Same tau_rise clamp as the Rust side: tau_rise ~ tau_decay would
+    # collapse the biexponential to zero.
+    degenerate = np.abs(tr - td) < 1e-6 * np.maximum(np.maximum(td, tr), 1e-12)
+    tr = np.where(degenerate, td * 0.5, tr)
+
+    dt = 1.0 / fs
+    lengths = np.maximum(np.ceil(-np.log(1e-6) * td / dt).astype(int), 2)
+    t = np.arange(int(lengths.max())) * dt
+    kernels = np.exp(-t / td[:, None]) - np.exp(-t / tr[:, None])
+    peaks = kernels.max(axis=1, keepdims=True)
+    kernels /= np.where(peaks > 0.0, peaks, 1.0)
+    return [
+        kernels[i, : lengths[i]].astype(np.float32) for i in range(kernels.shape[0])
+    ]
 
 
+def compute_lipschitz(kernel: np.ndarray) -> float:
+    """Compute Lipschitz constant. Delegates to Rust."""
+    # build_kernel already returns contiguous float32, so the common
+    # pipeline skips the coercion call entirely.
+    if not (
+        isinstance(kernel, np.ndarray)
+        and kernel.dtype == np.float32
+        and kernel.flags.c_contiguous
+    ):
+        kernel = np.ascontiguousarray(kernel, dtype=np.float32)
+    return _compute_lipschitz(kernel)
+
+
+@lru_cache(maxsize=256)
 def tau_to_ar2(
     tau_rise: float, tau_decay: float, fs: float,
 ) -> tuple[float, float, float, float]:
     """Derive AR(2) coefficients from tau parameters.
 
-    Pure Python (trivial math, no solver needed).
+    Pure Python (trivial math, no solver needed). Uses ``math.exp``
+    (no ndarray dispatch for scalars) and memoizes on the argument
+    triple — parameter sweeps revisit the same values constantly.
 
     Returns
     -------
@@ -116,11 +188,91 @@ def tau_to_ar2(
         d = exp(-dt/tau_decay), r = exp(-dt/tau_rise).
     """
     dt = 1.0 / fs
-    d = np.exp(-dt / tau_decay)
-    r = np.exp(-dt / tau_rise)
-    g1 = d + r
-    g2 = -(d * r)
-    return float(g1), float(g2), float(d), float(r)
+    d = math.exp(-dt / tau_decay)
+    r = math.exp(-dt / tau_rise)
+    return d + r, -(d * r), d, r
+
+
+# Filter solvers are cached per thread and reused across calls with the
+# same parameters and trace length, so repeated filtering (parameter
+# sweeps, per-row loops) pays solver construction and set_params once
+# instead of per call. Thread-local because PySolver is stateful.
+_filter_solvers = threading.local()
+_FILTER_CACHE_MAX = 8
+
+
+def _cached_filter_solver(
+    tau_rise: float, tau_decay: float, fs: float, n: int,
+) -> PySolver:
+    """Return a configured filter solver, reusing one when possible."""
+    cache = getattr(_filter_solvers, "cache", None)
+    if cache is None:
+        cache = _filter_solvers.cache = {}
+    key = (tau_rise, tau_decay, fs, n)
+    solver = cache.get(key)
+    if solver is None:
+        if len(cache) >= _FILTER_CACHE_MAX:
+            cache.clear()
+        solver = PySolver()
+        solver.set_params(tau_rise, tau_decay, 0.01, fs)  # lambda irrelevant for filter
+        solver.set_filter_enabled(True)
+        cache[key] = solver
+    return solver
+
+
+# Single-trace deconvolution solvers are pooled per thread, keyed by
+# trace length rounded up to the next power of two plus conv_mode. The
+# solver's FFT planner caches plans per padded length, so a parameter
+# sweep over one recording pays FFT planning once instead of per call.
+_decon_solvers = threading.local()
+
+
+def _pooled_decon_solver(n: int, conv_mode: str) -> PySolver:
+    """Return a pooled solver for single-trace deconvolution."""
+    cache = getattr(_decon_solvers, "cache", None)
+    if cache is None:
+        cache = _decon_solvers.cache = {}
+    key = (1 << (n - 1).bit_length(), conv_mode)
+    solver = cache.get(key)
+    if solver is None:
+        if len(cache) >= _FILTER_CACHE_MAX:
+            cache.clear()
+        solver = cache[key] = PySolver()
+    return solver
+
+
+def _deconvolve_single_pooled(
+    trace: np.ndarray,
+    fs: float,
+    tau_r: float,
+    tau_d: float,
+    lam: float,
+    max_iters: int,
+    conv_mode: str,
+    constraint: str,
+) -> tuple[np.ndarray, float, np.ndarray, int, bool]:
+    """Single-trace deconvolution through a pooled solver.
+
+    Mirrors the Rust ``deconvolve_single`` entry point (set trace,
+    subtract baseline, run to convergence) but keeps the solver — and
+    with it the planned FFTs — alive across calls.
+    """
+    solver = _pooled_decon_solver(trace.shape[0], conv_mode)
+    solver.set_params(tau_r, tau_d, lam, fs)
+    solver.set_conv_mode(conv_mode)
+    solver.set_constraint(constraint)
+    if trace.dtype != np.float32:
+        trace = np.ascontiguousarray(trace, dtype=np.float32)
+    solver.set_trace(trace)
+    solver.subtract_baseline()
+    solver.solve(max_iters)
+    return (
+        solver.get_solution(),
+        solver.get_baseline(),
+        solver.get_reconvolution_with_baseline(),
+        solver.iteration_count(),
+        solver.converged(),
+    )
 
 
 def bandpass_filter(
@@ -128,21 +280,72 @@ def bandpass_filter(
     tau_rise: float,
     tau_decay: float,
     fs: float,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
-    """Apply FFT bandpass filter derived from kernel time constants. Delegates to Rust."""
-    n = len(trace)
+    """Apply FFT bandpass filter derived from kernel time constants. Delegates to Rust.
+
+    Accepts a single trace, shape ``(n_timepoints,)``, or a batch, shape
+    ``(n_cells, n_timepoints)``. A batch shares one solver across rows so
+    parameter setup is paid once instead of per cell. ``out``, if given,
+    receives the result (must match the input's shape) — callers filtering
+    large batches can preallocate once instead of paying a fresh N×T
+    allocation per call.
+    """
+    arr = np.asarray(trace)
+    single_trace = arr.ndim == 1
+    traces_2d = np.atleast_2d(arr)
+    n = traces_2d.shape[1]
+    if out is not None and out.shape != arr.shape:
+        raise ValueError(f"out shape {out.shape} does not match input shape {arr.shape}")
     if n < 8:
-        return trace.copy()
-
-    solver = PySolver()
-    solver.set_params(tau_rise, tau_decay, 0.01, fs)  # lambda irrelevant for filter
-    solver.set_filter_enabled(True)
-    trace_f32 = np.ascontiguousarray(trace, dtype=np.float32)
-    solver.set_trace(trace_f32)
-    applied = solver.apply_filter()
-    if not applied:
-        return trace.copy()
-    return np.asarray(solver.get_trace(), dtype=np.float64)
+        if out is not None:
+            np.copyto(out, arr)
+            return out
+        return arr.copy()
+
+    solver = _cached_filter_solver(tau_rise, tau_decay, fs, n)
+
+    if out is None:
+        dest = np.empty(traces_2d.shape, dtype=np.float64)
+    else:
+        dest = np.atleast_2d(out)
+    for i in range(traces_2d.shape[0]):
+        solver.set_trace(np.ascontiguousarray(traces_2d[i], dtype=np.float32))
+        if solver.apply_filter():
+            dest[i] = solver.get_trace()
+        else:
+            # Invalid cutoffs for these params — same for every row.
+            if out is not None:
+                np.copyto(out, arr)
+                return out
+            return arr.copy()
+
+    if out is not None:
+        return out
+    return dest[0] if single_trace else dest
+
+
+def _prepare_decon_input(traces: np.ndarray):
+    """Pick the batch entry point matching the input dtype.
+
+    The Rust solver works in float32 internally, so float32 input goes
+    to the ``*_f32`` binding with no widening copy — for an
+    ``(n_cells, n_t)`` dataset that halves the memory footprint and
+    bandwidth of the handoff. Everything else takes the float64 path.
+
+    Returns ``(traces_2d, batch_fn, out_dtype)``; activity comes back
+    in ``out_dtype`` so float32 in means float32 out.
+    """
+    if traces.dtype == np.float32:
+        arr = np.ascontiguousarray(traces)
+        batch_fn, out_dtype = _deconvolve_batch_f32, np.float32
+    else:
+        arr = np.ascontiguousarray(traces, dtype=np.float64)
+        batch_fn, out_dtype = _deconvolve_batch, np.float64
+    if arr.ndim == 1:
+        # Already contiguous, so this is a view, not a second pass.
+        arr = arr.reshape(1, -1)
+    return arr, batch_fn, out_dtype
 
 
 def run_deconvolution(
@@ -186,21 +389,23 @@ def run_deconvolution(
         Non-negative activity estimates, same shape as input ``traces``.
     """
     single_trace = traces.ndim == 1
-    traces_2d = np.atleast_2d(np.asarray(traces, dtype=np.float64))
+    traces_2d, batch_fn, out_dtype = _prepare_decon_input(traces)
 
     if traces_2d.shape[0] == 1:
-        activity, _, _, _, _ = _deconvolve_single(
-            traces_2d[0], fs, tau_r, tau_d, lam, max_iters=max_iters,
-            conv_mode=conv_mode, constraint=constraint,
+        activity, _, _, _, _ = _deconvolve_single_pooled(
+            traces_2d[0], fs, tau_r, tau_d, lam, max_iters, conv_mode, constraint,
         )
-        result = np.asarray(activity, dtype=np.float64)
+        result = np.asarray(activity, dtype=out_dtype)
         return result if single_trace else result.reshape(1, -1)
 
-    activities, _, _, _, _ = _deconvolve_batch(
+    activities, _, _, _, _ = batch_fn(
         traces_2d, fs, tau_r, tau_d, lam, max_iters=max_iters,
         conv_mode=conv_mode, constraint=constraint,
     )
-    return np.stack([np.asarray(a, dtype=np.float64) for a in activities])
+    # The binding returns a contiguous (n_cells, n_t) float32 matrix;
+    # this is a zero-copy pass-through for float32 callers and a single
+    # conversion pass for float64.
+    return np.asarray(activities, dtype=out_dtype)
 
 
 def run_deconvolution_full(
@@ -243,30 +448,29 @@ def run_deconvolution_full(
         ``iterations``, ``converged``.
     """
     single_trace = traces.ndim == 1
-    traces_2d = np.atleast_2d(np.asarray(traces, dtype=np.float64))
+    traces_2d, batch_fn, out_dtype = _prepare_decon_input(traces)
 
     if single_trace:
-        activity, baseline, reconvolution, iterations, converged = _deconvolve_single(
-            traces_2d[0], fs, tau_r, tau_d, lam, max_iters=max_iters,
-            conv_mode=conv_mode, constraint=constraint,
+        activity, baseline, reconvolution, iterations, converged = _deconvolve_single_pooled(
+            traces_2d[0], fs, tau_r, tau_d, lam, max_iters, conv_mode, constraint,
         )
         return DeconvolutionResult(
-            activity=np.asarray(activity, dtype=np.float64),
+            activity=np.asarray(activity, dtype=out_dtype),
             baseline=baseline,
-            reconvolution=np.asarray(reconvolution, dtype=np.float64),
+            reconvolution=np.asarray(reconvolution, dtype=out_dtype),
             iterations=int(iterations),
             converged=bool(converged),
         )
 
-    activities, baselines, reconvolutions, iterations, convergeds = _deconvolve_batch(
+    activities, baselines, reconvolutions, iterations, convergeds = batch_fn(
         traces_2d, fs, tau_r, tau_d, lam, max_iters=max_iters,
         conv_mode=conv_mode, constraint=constraint,
     )
 
     return DeconvolutionResult(
-        activity=np.stack([np.asarray(a, dtype=np.float64) for a in activities]),
+        activity=np.asarray(activities, dtype=out_dtype),
         baseline=np.array(baselines),
-        reconvolution=np.stack([np.asarray(r, dtype=np.float64) for r in reconvolutions]),
+        reconvolution=np.asarray(reconvolutions, dtype=out_dtype),
         iterations=np.array(iterations, dtype=int),
         converged=np.array(convergeds, dtype=bool),
     )
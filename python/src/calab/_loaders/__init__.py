@@ -9,20 +9,25 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import os
+
     import numpy as np
+    import zarr
 
 
 def load_caiman(
-    path: str,
+    path: str | os.PathLike[str],
     trace_key: str = "estimates/C",
     fs_key: str = "params/data/fr",
     fs: float | None = None,
+    dtype: str | None = None,
+    out: np.ndarray | None = None,
 ) -> tuple[np.ndarray, dict]:
     """Load traces from a CaImAn HDF5 results file.
 
     Parameters
     ----------
-    path : str
+    path : str or os.PathLike
         Path to the CaImAn HDF5 file (e.g., ``caiman_results.hdf5``).
     trace_key : str
         HDF5 key for the traces array. Default: ``"estimates/C"``.
@@ -30,14 +35,22 @@ def load_caiman(
         HDF5 key for the sampling rate. Default: ``"params/data/fr"``.
     fs : float, optional
         Override sampling rate. If provided, ``fs_key`` is ignored.
+    dtype : str, optional
+        Convert traces to this dtype during the read. By default the
+        file's dtype is preserved (float32 for typical CaImAn output).
+    out : np.ndarray, optional
+        Preallocated destination buffer; must match the dataset's
+        shape. The data is read directly into it, skipping the fresh
+        allocation per call.
 
     Returns
     -------
     traces : np.ndarray
-        Traces array, shape ``(n_cells, n_timepoints)``, dtype float64.
+        Traces array, shape ``(n_cells, n_timepoints)``, in the file's
+        dtype unless ``dtype`` is given.
     metadata : dict
         Metadata dict with keys: ``source``, ``sampling_rate_hz``,
-        ``num_cells``, ``num_timepoints``.
+        ``num_cells``, ``num_timepoints``, ``dtype``.
 
     Raises
     ------
@@ -50,33 +63,39 @@ def load_caiman(
     """
     from ._caiman import load_caiman as _load
 
-    return _load(path, trace_key=trace_key, fs_key=fs_key, fs=fs)
+    return _load(path, trace_key=trace_key, fs_key=fs_key, fs=fs, dtype=dtype, out=out)
 
 
 def load_minian(
-    path: str,
+    path: str | os.PathLike[str] | zarr.Group,
     trace_key: str = "C",
     fs: float | None = None,
+    dtype: str | None = None,
 ) -> tuple[np.ndarray, dict]:
     """Load traces from a Minian Zarr output directory.
 
     Parameters
     ----------
-    path : str
-        Path to the Minian Zarr directory (e.g., ``minian_output/``).
+    path : str, os.PathLike, or zarr.Group
+        Path to the Minian Zarr directory (e.g., ``minian_output/``),
+        or an already-open Zarr group (any store zarr can read).
     trace_key : str
         Zarr key for the traces array. Default: ``"C"``.
     fs : float, optional
         Sampling rate in Hz. Minian does not store this, so it must
         be provided (or will default to None in metadata).
+    dtype : str, optional
+        Convert traces to this dtype during the load. By default the
+        store's dtype is preserved.
 
     Returns
     -------
     traces : np.ndarray
-        Traces array, shape ``(n_cells, n_timepoints)``, dtype float64.
+        Traces array, shape ``(n_cells, n_timepoints)``, in the store's
+        dtype unless ``dtype`` is given.
     metadata : dict
         Metadata dict with keys: ``source``, ``sampling_rate_hz``,
-        ``num_cells``, ``num_timepoints``.
+        ``num_cells``, ``num_timepoints``, ``dtype``.
 
     Raises
     ------
@@ -89,4 +108,4 @@ def load_minian(
     """
     from ._minian import load_minian as _load
 
-    return _load(path, trace_key=trace_key, fs=fs)
+    return _load(path, trace_key=trace_key, fs=fs, dtype=dtype)
@@ -2,27 +2,46 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import numpy as np
 
+try:
+    # Optional dependency; this module is itself lazily imported, so
+    # paying the import once here keeps repeated load_caiman calls free
+    # of per-call import machinery.
+    import h5py
+except ImportError:
+    h5py = None
+
 
 def load_caiman(
-    path: str,
+    path: str | os.PathLike[str],
     trace_key: str = "estimates/C",
     fs_key: str = "params/data/fr",
     fs: float | None = None,
+    dtype: str | None = None,
+    out: np.ndarray | None = None,
 ) -> tuple[np.ndarray, dict]:
-    """Load traces from a CaImAn HDF5 results file."""
-    try:
-        import h5py
-    except ImportError:
+    """Load traces from a CaImAn HDF5 results file.
+
+    By default traces keep the file's dtype (float32 for typical CaImAn
+    output) — the solver handles float32 natively, so upcasting at load
+    time would only double memory and I/O. Pass ``dtype`` to convert
+    during the read. ``out``, if given, receives the data directly
+    (must match the dataset's shape) — callers re-loading into the same
+    buffer skip the fresh allocation per call.
+    """
+    if h5py is None:
         raise ImportError(
             "h5py is required to load CaImAn files. "
             "Install it with: pip install calab[loaders]"
-        ) from None
+        )
 
-    path = str(path)
+    # One os.fspath up front: str and Path callers alike resolve once,
+    # with no Path -> str -> Path round-trips further down.
+    path = os.fspath(path)
     if not Path(path).exists():
         raise FileNotFoundError(f"CaImAn HDF5 file not found: {path}")
 
@@ -32,21 +51,37 @@ def load_caiman(
                 f"Trace key '{trace_key}' not found in {path}. "
                 f"Available keys: {list(f.keys())}"
             )
-        traces = np.asarray(f[trace_key], dtype=np.float64)
+        # read_direct decompresses straight into the destination buffer,
+        # converting dtype during the read — no intermediate source-dtype
+        # array, so peak memory stays at one copy of the data.
+        dset = f[trace_key]
+        if out is not None:
+            if out.shape != dset.shape:
+                raise ValueError(
+                    f"out shape {out.shape} does not match dataset shape {dset.shape}"
+                )
+            traces = out
+        else:
+            traces = np.empty(
+                dset.shape, dtype=dset.dtype if dtype is None else np.dtype(dtype),
+            )
+        dset.read_direct(traces)
 
         # Read sampling rate from file if not provided
         if fs is None and fs_key in f:
             fs = float(np.asarray(f[fs_key]))
 
-    # Ensure 2D
+    # Ensure 2D — np.newaxis is always a view, unlike reshape which can
+    # copy a non-contiguous array.
     if traces.ndim == 1:
-        traces = traces.reshape(1, -1)
+        traces = traces[np.newaxis, :]
 
     metadata = {
         "source": "caiman",
         "sampling_rate_hz": fs,
         "num_cells": int(traces.shape[0]),
         "num_timepoints": int(traces.shape[1]),
+        "dtype": str(traces.dtype),
     }
 
     return traces, metadata
@@ -2,30 +2,51 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import numpy as np
 
+try:
+    # Optional dependency; this module is itself lazily imported, so
+    # paying the import once here keeps repeated load_minian calls free
+    # of per-call import machinery.
+    import zarr
+except ImportError:
+    zarr = None
+
 
 def load_minian(
-    path: str,
+    path: str | os.PathLike[str] | zarr.Group,
     trace_key: str = "C",
     fs: float | None = None,
+    dtype: str | None = None,
 ) -> tuple[np.ndarray, dict]:
-    """Load traces from a Minian Zarr output directory."""
-    try:
-        import zarr
-    except ImportError:
+    """Load traces from a Minian Zarr output directory or open group.
+
+    By default traces keep the store's dtype — the solver handles
+    float32 natively, so upcasting at load time would only double
+    memory and I/O. Pass ``dtype`` to convert during the load.
+    """
+    if zarr is None:
         raise ImportError(
             "zarr is required to load Minian files. "
             "Install it with: pip install calab[loaders]"
-        ) from None
-
-    path = str(path)
-    if not Path(path).exists():
-        raise FileNotFoundError(f"Minian Zarr directory not found: {path}")
+        )
 
-    store = zarr.open(path, mode="r")
+    if isinstance(path, (str, os.PathLike)):
+        # One os.fspath up front: str and Path callers alike resolve
+        # once, with no Path -> str -> Path round-trips further down.
+        path = os.fspath(path)
+        if not Path(path).exists():
+            raise FileNotFoundError(f"Minian Zarr directory not found: {path}")
+        store = zarr.open(path, mode="r")
+    elif isinstance(path, zarr.Group):
+        # An already-open group (e.g. backed by an in-memory store)
+        # skips the path resolution and filesystem open entirely.
+        store = path
+    else:
+        store = zarr.open(path, mode="r")
 
     if trace_key not in store:
         raise KeyError(
@@ -33,17 +54,24 @@ def load_minian(
             f"Available keys: {list(store.keys())}"
         )
 
-    traces = np.asarray(store[trace_key], dtype=np.float64)
+    # Materialize once in the store's dtype, then pass straight through
+    # unless a conversion was explicitly requested — the loader is a
+    # zero-extra-copy wrapper for the common case.
+    traces = store[trace_key][...]
+    if dtype is not None and traces.dtype != np.dtype(dtype):
+        traces = np.ascontiguousarray(traces, dtype=np.dtype(dtype))
 
-    # Ensure 2D
+    # Ensure 2D — np.newaxis is always a view, unlike reshape which can
+    # copy a non-contiguous array.
     if traces.ndim == 1:
-        traces = traces.reshape(1, -1)
+        traces = traces[np.newaxis, :]
 
     metadata = {
         "source": "minian",
         "sampling_rate_hz": fs,
         "num_cells": int(traces.shape[0]),
         "num_timepoints": int(traces.shape[1]),
+        "dtype": str(traces.dtype),
     }
 
     return traces, metadata
@@ -1,7 +1,9 @@
 """Shared pytest fixtures for CaLab Python tests.
 
 Provides standard parameter sets and pre-built kernels for reuse
-across test modules.
+across test modules. Fixtures are session-scoped: the values are
+treated as immutable, so building them once avoids re-running the
+kernel build for every test that uses them.
 """
 
 from __future__ import annotations
@@ -11,7 +13,31 @@ import numpy as np
 from calab import build_kernel
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def rng() -> np.random.Generator:
+    """Shared random generator for value-irrelevant test data.
+
+    Use this where the test only needs "some data" and asserts
+    self-consistently (round-trips, shape checks); tests whose
+    tolerances depend on specific draws should keep their own fixed
+    seed so failures reproduce in isolation.
+    """
+    return np.random.default_rng(0xC0FFEE)
+
+
+@pytest.fixture(scope="session")
+def h5py_mod():
+    """h5py module, imported once per session (skips dependents if absent)."""
+    return pytest.importorskip("h5py", reason="h5py not installed")
+
+
+@pytest.fixture(scope="session")
+def zarr_mod():
+    """zarr module, imported once per session (skips dependents if absent)."""
+    return pytest.importorskip("zarr", reason="zarr not installed")
+
+
+@pytest.fixture(scope="session")
 def standard_params() -> dict:
     """Standard calcium imaging parameters.
 
@@ -21,7 +47,7 @@ def standard_params() -> dict:
     return {"tau_rise": 0.04, "tau_decay": 0.4, "fs": 30.0}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fast_params() -> dict:
     """Fast kinetics parameters.
 
@@ -32,7 +58,7 @@ def fast_params() -> dict:
     return {"tau_rise": 0.015, "tau_decay": 0.15, "fs": 100.0}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def slow_params() -> dict:
     """Slow kinetics parameters.
 
@@ -43,7 +69,22 @@ def slow_params() -> dict:
     return {"tau_rise": 0.05, "tau_decay": 1.0, "fs": 20.0}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def standard_kernel(standard_params: dict) -> np.ndarray:
     """Pre-built kernel with standard parameters."""
     return build_kernel(**standard_params)
+
+
+@pytest.fixture(scope="session")
+def synthetic_trace() -> np.ndarray:
+    """Two-spike synthetic trace (tau_rise=0.02, tau_decay=0.4, fs=30).
+
+    200 samples with spikes at indices 50 and 120, convolved with the
+    matching kernel. Built once per session; treat as immutable.
+    """
+    kernel = build_kernel(0.02, 0.4, 30.0)
+    n = 200
+    spikes = np.zeros(n)
+    spikes[50] = 1.0
+    spikes[120] = 1.0
+    return np.convolve(spikes, kernel)[:n]
@@ -33,6 +33,7 @@ def bridge_server():
     _start_server(server)
     yield server
     server.shutdown()
+    server.server_close()
 
 
 @pytest.fixture
@@ -42,6 +43,7 @@ def cadecon_server():
     _start_server(server)
     yield server
     server.shutdown()
+    server.server_close()
 
 
 def _get(server: BridgeServer, path: str, *, secret: bool = True) -> tuple[int, bytes]:
@@ -134,6 +136,57 @@ def test_traces_endpoint(bridge_server: BridgeServer) -> None:
     npt.assert_allclose(arr, bridge_server.traces)
 
 
+def test_traces_gzip_when_accepted(bridge_server: BridgeServer) -> None:
+    """GET /api/v1/traces serves the gzip variant when the client accepts it."""
+    import gzip
+    import io
+
+    url = f"http://127.0.0.1:{bridge_server.port}/api/v1/traces"
+    req = urllib.request.Request(url)
+    req.add_header("X-Bridge-Secret", bridge_server.secret)
+    req.add_header("Accept-Encoding", "gzip")
+    with urllib.request.urlopen(req, timeout=5) as resp:
+        assert resp.headers["Content-Encoding"] == "gzip"
+        body = resp.read()
+
+    arr = np.load(io.BytesIO(gzip.decompress(body)))
+    npt.assert_allclose(arr, bridge_server.traces)
+
+
+def test_traces_dtype_preserved() -> None:
+    """float32 input is served as float32 (no float64 upcast)."""
+    traces = np.random.default_rng(1).standard_normal((2, 50)).astype(np.float32)
+    server = BridgeServer(traces, fs=30.0)
+    try:
+        assert server.traces.dtype == np.float32
+        import io
+
+        arr = np.load(io.BytesIO(server._traces_npy))
+        assert arr.dtype == np.float32
+    finally:
+        server.server_close()
+
+
+def test_traces_dtype_override() -> None:
+    """Explicit dtype downcasts float64 input for bandwidth."""
+    traces = np.random.default_rng(1).standard_normal((2, 50))
+    server = BridgeServer(traces, fs=30.0, dtype="float32")
+    try:
+        assert server.traces.dtype == np.float32
+    finally:
+        server.server_close()
+
+
+def test_traces_contiguous_2d_not_copied() -> None:
+    """A C-contiguous 2-D float array is held by reference, not copied."""
+    traces = np.random.default_rng(1).standard_normal((2, 50))
+    server = BridgeServer(traces, fs=30.0)
+    try:
+        assert server.traces is traces
+    finally:
+        server.server_close()
+
+
 def test_params_post(bridge_server: BridgeServer) -> None:
     """POST /api/v1/params stores params and triggers event."""
     params = {
@@ -150,12 +203,12 @@ def test_params_post(bridge_server: BridgeServer) -> None:
     assert status == 200
 
     # Event should be set
-    assert bridge_server.params_event.is_set()
+    assert bridge_server.params_ready
     assert bridge_server.received_params == params
 
 
-def test_params_event_wait(bridge_server: BridgeServer) -> None:
-    """params_event.wait() returns True after POST."""
+def test_wait_for_params(bridge_server: BridgeServer) -> None:
+    """wait_for_params() returns True after POST."""
     params = {"parameters": {"tau_rise_s": 0.05}}
 
     # Post in background
@@ -166,7 +219,7 @@ def test_params_event_wait(bridge_server: BridgeServer) -> None:
     threading.Thread(target=post_later, daemon=True).start()
 
     # Wait for params
-    received = bridge_server.params_event.wait(timeout=5)
+    received = bridge_server.wait_for_params(timeout=5)
     assert received is True
     assert bridge_server.received_params is not None
 
@@ -250,12 +303,12 @@ def test_results_activity_post(cadecon_server: BridgeServer) -> None:
 
 
 def test_results_json_post(cadecon_server: BridgeServer) -> None:
-    """POST /api/v1/results stores JSON and triggers results_event."""
+    """POST /api/v1/results stores JSON and flags results_ready."""
     results = {"alphas": [1.0, 2.0], "fs": 30.0, "tau_rise": 0.2}
 
     status, body = _post(cadecon_server, "/api/v1/results", results)
     assert status == 200
-    assert cadecon_server.results_event.is_set()
+    assert cadecon_server.results_ready
     assert cadecon_server.received_results == results
 
 
@@ -270,8 +323,8 @@ def test_results_two_post_sequence(cadecon_server: BridgeServer) -> None:
     status, _ = _post_binary(cadecon_server, "/api/v1/results/activity", buf.getvalue())
     assert status == 200
 
-    # results_event should NOT be set yet
-    assert not cadecon_server.results_event.is_set()
+    # results_ready should NOT be flagged yet
+    assert not cadecon_server.results_ready
 
     # 2. POST results JSON
     results = {"alphas": [1.0, 1.0], "fs": 30.0}
@@ -279,7 +332,7 @@ def test_results_two_post_sequence(cadecon_server: BridgeServer) -> None:
     assert status == 200
 
     # Now both should be stored
-    assert cadecon_server.results_event.is_set()
+    assert cadecon_server.results_ready
     assert cadecon_server.received_activity is not None
     assert cadecon_server.received_results == results
     npt.assert_array_equal(cadecon_server.received_activity, activity)
@@ -304,6 +357,7 @@ def config_server():
     _start_server(server)
     yield server
     server.shutdown()
+    server.server_close()
 
 
 def test_config_endpoint_empty(cadecon_server: BridgeServer) -> None:
@@ -487,16 +541,16 @@ def test_options_without_pna_request_omits_pna_header(bridge_server: BridgeServe
 
 
 def test_run_bridge_timeout_returns_false() -> None:
-    """``_run_bridge`` exits with False when the bridge event never fires."""
+    """``_run_bridge`` exits with False when the rendezvous never fires."""
     from calab._bridge._apps import _run_bridge
 
     server = _make_server()
-    event = threading.Event()
 
     start = time.monotonic()
     received = _run_bridge(
         server,
-        event,
+        lambda: server.params_ready,
+        server.wait_for_params,
         app_name="CaTune",
         app_url="about:blank",  # webbrowser.open on a noop URL
         open_browser=False,
@@ -510,31 +564,32 @@ def test_run_bridge_timeout_returns_false() -> None:
     assert elapsed < 3.0, f"timeout respected (elapsed={elapsed:.2f}s)"
 
 
-def test_run_bridge_detects_browser_crash_via_heartbeat_timeout(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """A dead browser is detected when ``last_heartbeat`` goes stale.
+def test_run_bridge_detects_browser_crash_via_heartbeat_timeout() -> None:
+    """A dead browser is detected when heartbeats stop arriving.
 
-    Simulates a browser that started (sent at least one heartbeat) and then
-    crashed or was killed: ``_run_bridge`` should notice
-    ``now - last_heartbeat > HEARTBEAT_TIMEOUT`` on its next tick and exit
-    False instead of hanging until the outer timeout.
+    Simulates a browser that started (sent one heartbeat) and then
+    crashed or was killed: the watchdog armed by that heartbeat fires
+    after ``heartbeat_timeout`` with no further POSTs, sets the server's
+    ``disconnected`` event, and ``_run_bridge`` exits False immediately
+    instead of hanging until the outer timeout.
     """
-    from calab._bridge import _apps
     from calab._bridge._apps import _run_bridge
 
-    # Shorten HEARTBEAT_TIMEOUT so the loop's 1s tick can reliably fire.
-    monkeypatch.setattr(_apps, "HEARTBEAT_TIMEOUT", 0.1)
+    server = _make_server(heartbeat_timeout=0.2)
 
-    server = _make_server()
-    event = threading.Event()
-    # Prime with a heartbeat that arrived "long ago" from the loop's POV.
-    server.last_heartbeat = time.monotonic() - 5.0
+    def heartbeat_once() -> None:
+        # Give _run_bridge time to start serve_forever, then send the
+        # one-and-only heartbeat. The crash is the silence that follows.
+        time.sleep(0.2)
+        _post(server, "/api/v1/heartbeat", {})
+
+    threading.Thread(target=heartbeat_once, daemon=True).start()
 
     start = time.monotonic()
     received = _run_bridge(
         server,
-        event,
+        lambda: server.results_ready,
+        server.wait_for_results,
         app_name="CaDecon",
         app_url="about:blank",
         open_browser=False,
@@ -543,8 +598,7 @@ def test_run_bridge_detects_browser_crash_via_heartbeat_timeout(
     elapsed = time.monotonic() - start
 
     assert received is False, "heartbeat timeout path must return False"
-    # Heartbeat check runs inside the wait loop that ticks every 1.0s, so
-    # first detection lands on the next tick. Cap at 3s to guard against
+    # One 0.2s delay + 0.2s watchdog; cap at 3s to guard against
     # regressions that fall through to the outer `timeout=10`.
     assert elapsed < 3.0, (
         f"heartbeat detection too slow: elapsed={elapsed:.2f}s (would hit outer 10s fallback)"
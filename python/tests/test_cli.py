@@ -29,9 +29,9 @@ def test_version() -> None:
     assert __version__ in result.stdout
 
 
-def test_info_npy(tmp_path: Path) -> None:
+def test_info_npy(tmp_path: Path, rng: np.random.Generator) -> None:
     """info subcommand shows .npy file details."""
-    data = np.random.default_rng(42).standard_normal((5, 200))
+    data = rng.standard_normal((5, 200))
     npy_path = str(tmp_path / "traces.npy")
     np.save(npy_path, data)
 
@@ -65,18 +65,10 @@ def test_info_json(tmp_path: Path) -> None:
     assert "tau_rise_s" in result.stdout
 
 
-def test_deconvolve(tmp_path: Path) -> None:
+def test_deconvolve(tmp_path: Path, synthetic_trace: np.ndarray) -> None:
     """deconvolve subcommand produces output .npy."""
-    # Create synthetic data
-    from calab import build_kernel
-
-    kernel = build_kernel(0.02, 0.4, 30.0)
-    n = 200
-    spikes = np.zeros(n)
-    spikes[50] = 1.0
-    spikes[120] = 1.0
-    trace = np.convolve(spikes, kernel)[:n]
-    traces = trace.reshape(1, -1)
+    n = len(synthetic_trace)
+    traces = synthetic_trace.reshape(1, -1)
 
     npy_path = str(tmp_path / "traces.npy")
     np.save(npy_path, traces)
@@ -112,6 +104,52 @@ def test_deconvolve(tmp_path: Path) -> None:
     assert np.all(activity >= 0)
 
 
+def test_deconvolve_full(tmp_path: Path, synthetic_trace: np.ndarray) -> None:
+    """deconvolve --full writes the .npz info sidecar and params JSON."""
+    n = len(synthetic_trace)
+    traces = np.stack([synthetic_trace, synthetic_trace])
+
+    npy_path = str(tmp_path / "traces.npy")
+    np.save(npy_path, traces)
+
+    export = {
+        "schema_version": "1.1.0",
+        "catune_version": "test",
+        "export_date": "2025-01-01",
+        "parameters": {
+            "tau_rise_s": 0.02,
+            "tau_decay_s": 0.4,
+            "lambda": 0.01,
+            "sampling_rate_hz": 30.0,
+            "filter_enabled": False,
+        },
+        "ar2_coefficients": {},
+        "formulation": {},
+        "metadata": {},
+    }
+    json_path = str(tmp_path / "export.json")
+    with open(json_path, "w") as f:
+        json.dump(export, f)
+
+    output_path = str(tmp_path / "activity.npy")
+    result = run_cli(
+        "deconvolve", npy_path, "--params", json_path, "-o", output_path, "--full"
+    )
+
+    assert result.returncode == 0
+    assert np.load(output_path).shape == (2, n)
+
+    with np.load(str(tmp_path / "activity_info.npz")) as info:
+        assert info["baseline"].shape == (2,)
+        assert info["iterations"].shape == (2,)
+        assert info["converged"].shape == (2,)
+
+    with open(tmp_path / "activity_info.json") as f:
+        meta = json.load(f)
+    assert meta["fs"] == 30.0
+    assert meta["lam"] == 0.01
+
+
 def test_info_with_metadata(tmp_path: Path) -> None:
     """info shows metadata sidecar info when present."""
     traces = np.zeros((2, 100))
@@ -105,3 +105,37 @@ def test_output_length_matches_input():
 
     filtered = bandpass_filter(trace, tau_rise=0.02, tau_decay=0.4, fs=100.0)
     assert len(filtered) == n
+
+
+# ---------------------------------------------------------------------------
+# Test 7: Batch input matches per-row filtering
+# ---------------------------------------------------------------------------
+
+def test_batch_matches_per_row():
+    """2D input filters each row identically to separate 1D calls."""
+    rng = np.random.default_rng(7)
+    traces = rng.standard_normal((3, 256))
+
+    batch = bandpass_filter(traces, tau_rise=0.02, tau_decay=0.4, fs=100.0)
+
+    assert batch.shape == traces.shape
+    for i in range(traces.shape[0]):
+        row = bandpass_filter(traces[i], tau_rise=0.02, tau_decay=0.4, fs=100.0)
+        np.testing.assert_array_equal(batch[i], row)
+
+
+# ---------------------------------------------------------------------------
+# Test 8: Preallocated output buffer
+# ---------------------------------------------------------------------------
+
+def test_out_buffer_receives_result():
+    """out= writes into the caller's buffer and matches the normal path."""
+    rng = np.random.default_rng(11)
+    traces = rng.standard_normal((2, 256))
+    dest = np.empty(traces.shape)
+
+    returned = bandpass_filter(traces, tau_rise=0.02, tau_decay=0.4, fs=100.0, out=dest)
+    expected = bandpass_filter(traces, tau_rise=0.02, tau_decay=0.4, fs=100.0)
+
+    assert returned is dest
+    np.testing.assert_array_equal(dest, expected)
@@ -325,3 +325,83 @@ def test_full_result_multi_trace():
     assert result.reconvolution.shape == (2, n)
     assert result.iterations.shape == (2,)
     assert result.converged.shape == (2,)
+
+
+# ---------------------------------------------------------------------------
+# Test 15: float32 input path
+# ---------------------------------------------------------------------------
+
+def test_float32_dtype_out():
+    """float32 in means float32 out; float64 in stays float64."""
+    kernel = build_kernel(0.02, 0.4, 30.0)
+    n = 200
+    trace64 = make_synthetic_trace(kernel, n, [50, 120])
+    trace32 = trace64.astype(np.float32)
+
+    # Single trace (pooled-solver path).
+    assert run_deconvolution(trace32, 30.0, 0.02, 0.4, 0.01).dtype == np.float32
+    assert run_deconvolution(trace64, 30.0, 0.02, 0.4, 0.01).dtype == np.float64
+
+    # Batch (>= 2 rows, exercises the *_f32 batch binding).
+    batch32 = np.stack([trace32, trace32])
+    batch64 = np.stack([trace64, trace64])
+    assert run_deconvolution(batch32, 30.0, 0.02, 0.4, 0.01).dtype == np.float32
+    assert run_deconvolution(batch64, 30.0, 0.02, 0.4, 0.01).dtype == np.float64
+
+
+def test_float32_float64_agreement():
+    """float32 and float64 inputs produce matching activity.
+
+    The solver computes in float32 either way (the float64 path narrows
+    the trace on entry), so the two paths should agree to float32
+    precision — single trace and batch alike.
+    """
+    kernel = build_kernel(0.02, 0.4, 30.0)
+    n = 200
+    trace64 = make_synthetic_trace(kernel, n, [50, 120])
+    trace32 = trace64.astype(np.float32)
+
+    sol32 = run_deconvolution(trace32, 30.0, 0.02, 0.4, 0.01)
+    sol64 = run_deconvolution(trace64, 30.0, 0.02, 0.4, 0.01)
+    npt.assert_allclose(sol32, sol64, rtol=1e-6, atol=1e-7)
+
+    batch32 = run_deconvolution(np.stack([trace32, trace32]), 30.0, 0.02, 0.4, 0.01)
+    batch64 = run_deconvolution(np.stack([trace64, trace64]), 30.0, 0.02, 0.4, 0.01)
+    npt.assert_allclose(batch32, batch64, rtol=1e-6, atol=1e-7)
+
+
+def test_full_float32_dtype_out():
+    """run_deconvolution_full preserves float32 in activity/reconvolution."""
+    kernel = build_kernel(0.02, 0.4, 30.0)
+    n = 200
+    trace32 = make_synthetic_trace(kernel, n, [50, 120]).astype(np.float32)
+
+    result = run_deconvolution_full(trace32, 30.0, 0.02, 0.4, 0.01)
+    assert result.activity.dtype == np.float32
+    assert result.reconvolution.dtype == np.float32
+
+    batch = run_deconvolution_full(np.stack([trace32, trace32]), 30.0, 0.02, 0.4, 0.01)
+    assert batch.activity.dtype == np.float32
+    assert batch.reconvolution.dtype == np.float32
+
+
+def test_single_f32_binding_matches_f64():
+    """deconvolve_single_f32 returns the same result as deconvolve_single."""
+    from calab._solver import deconvolve_single, deconvolve_single_f32
+
+    kernel = build_kernel(0.02, 0.4, 30.0)
+    trace64 = make_synthetic_trace(kernel, 200, [50, 120])
+    trace32 = trace64.astype(np.float32)
+
+    act32, base32, recon32, iters32, conv32 = deconvolve_single_f32(
+        trace32, 30.0, 0.02, 0.4, 0.01
+    )
+    act64, base64, recon64, iters64, conv64 = deconvolve_single(
+        trace64, 30.0, 0.02, 0.4, 0.01
+    )
+
+    npt.assert_array_equal(act32, act64)
+    assert base32 == base64
+    npt.assert_array_equal(recon32, recon64)
+    assert iters32 == iters64
+    assert conv32 == conv64
@@ -64,9 +64,8 @@ def _write_mock_export_json(path: Path, **overrides) -> Path:
 # Test 1: Save/load round-trip
 # ---------------------------------------------------------------------------
 
-def test_save_load_roundtrip(tmp_path: Path):
+def test_save_load_roundtrip(tmp_path: Path, rng: np.random.Generator):
     """Save random (5, 1000) array, load back, assert_allclose."""
-    rng = np.random.default_rng(42)
     traces = rng.standard_normal((5, 1000))
     path = str(tmp_path / "test_data")
 
@@ -132,9 +131,9 @@ def test_custom_metadata_preserved(tmp_path: Path):
 # Test 5: 1D input becomes 2D
 # ---------------------------------------------------------------------------
 
-def test_1d_input_becomes_2d(tmp_path: Path):
+def test_1d_input_becomes_2d(tmp_path: Path, rng: np.random.Generator):
     """Save 1D array, load back, verify shape is (1, n)."""
-    trace_1d = np.random.default_rng(0).standard_normal(200)
+    trace_1d = rng.standard_normal(200)
     path = str(tmp_path / "one_d")
 
     save_for_tuning(trace_1d, 30.0, path)
@@ -190,9 +189,9 @@ def test_load_missing_file_raises(tmp_path: Path):
 # Test 9: .npy format compatible with CaTune browser parser
 # ---------------------------------------------------------------------------
 
-def test_npy_format_compatible(tmp_path: Path):
+def test_npy_format_compatible(tmp_path: Path, rng: np.random.Generator):
     """Verify saved .npy is Float64, C-contiguous, little-endian."""
-    traces = np.random.default_rng(1).standard_normal((2, 50))
+    traces = rng.standard_normal((2, 50))
     path = str(tmp_path / "compat")
 
     save_for_tuning(traces, 30.0, path)
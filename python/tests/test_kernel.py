@@ -9,7 +9,7 @@ from __future__ import annotations
 import numpy as np
 from numpy.testing import assert_allclose
 
-from calab import build_kernel, tau_to_ar2, compute_lipschitz
+from calab import build_kernel, build_kernel_batch, tau_to_ar2, compute_lipschitz
 
 
 # --- build_kernel tests ---
@@ -108,20 +108,18 @@ def test_lipschitz_positive_and_bounded(standard_params: dict) -> None:
 
 
 def test_lipschitz_matches_reference() -> None:
-    """Lipschitz via compute_lipschitz matches explicit DFT loop (Rust algorithm).
+    """Lipschitz via compute_lipschitz matches an explicit DFT reference.
 
-    Computes the Lipschitz constant using an explicit loop matching the
-    Rust implementation's direct DFT, then compares with compute_lipschitz
-    which uses np.fft.fft. They should match within rtol=1e-10.
+    Computes the Lipschitz constant using an explicit direct-DFT loop
+    (independent of the Rust FFT implementation), then compares with
+    compute_lipschitz. They should match within rtol=1e-10.
     """
     kernel = build_kernel(0.02, 0.4, 30.0)
     n = len(kernel)
 
-    # Explicit DFT loop matching Rust code (lines 67-82 of kernel.rs)
-    fft_len = 1
+    # Next power of two >= 2n, as a single bit op.
     target = 2 * n
-    while fft_len < target:
-        fft_len *= 2
+    fft_len = 1 if target <= 1 else 1 << (target - 1).bit_length()
 
     max_power_ref = 0.0
     for w in range(fft_len):
@@ -170,6 +168,32 @@ def test_ar2_multiple_param_sets(
         assert discriminant >= 0.0, f"Negative discriminant for {params}"
 
 
+def test_build_kernel_batch_matches_per_call() -> None:
+    """Batched kernels match build_kernel pair by pair."""
+    tau_rises = np.array([0.02, 0.05, 0.1])
+    tau_decays = np.array([0.4, 0.8, 1.5])
+    fs = 30.0
+
+    kernels = build_kernel_batch(tau_rises, tau_decays, fs)
+
+    assert len(kernels) == 3
+    for kernel, tr, td in zip(kernels, tau_rises, tau_decays):
+        reference = build_kernel(tr, td, fs)
+        assert kernel.dtype == np.float32
+        assert len(kernel) == len(reference)
+        assert_allclose(kernel, reference, rtol=1e-6)
+
+
+def test_build_kernel_batch_broadcasts_scalar() -> None:
+    """A scalar tau_rise broadcasts against a vector of decays."""
+    tau_decays = np.array([0.4, 0.8])
+    kernels = build_kernel_batch(0.02, tau_decays, fs=30.0)
+
+    assert len(kernels) == 2
+    for kernel, td in zip(kernels, tau_decays):
+        assert_allclose(kernel, build_kernel(0.02, td, 30.0), rtol=1e-6)
+
+
 def test_lipschitz_empty_kernel() -> None:
     """Empty kernel returns floor value 1e-10."""
     result = compute_lipschitz(np.array([]))
@@ -1,7 +1,9 @@
 """Tests for format loaders (CaImAn HDF5, Minian Zarr).
 
-Tests create small fixtures in-test and verify round-trip loading.
-Marked with skipif when optional dependencies are missing.
+Read-only fixture files are built once per session (tests never mutate
+them, so no per-test copies are needed); tests that need a differently
+shaped file build their own. Marked with skipif when optional
+dependencies are missing.
 """
 
 from __future__ import annotations
@@ -12,158 +14,287 @@ import numpy as np
 import numpy.testing as npt
 import pytest
 
-# Check for optional dependencies
-h5py = pytest.importorskip("h5py", reason="h5py not installed")
-zarr = pytest.importorskip("zarr", reason="zarr not installed")
+from calab import load_caiman, load_minian
 
-from calab import load_caiman, load_minian  # noqa: E402 — imports run after importorskip gates
+# Optional-dependency gate: the session-scoped h5py_mod/zarr_mod
+# fixtures (conftest.py) import once per session and skip the module's
+# tests when absent. Deferring the imports to fixture setup also keeps
+# collection of deselected runs free of the ~100 ms h5py library load.
+pytestmark = pytest.mark.usefixtures("h5py_mod", "zarr_mod")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_io_libs(h5py_mod, zarr_mod) -> None:
+    """Front-load one-time HDF5/Zarr startup cost before the first test.
+
+    The first h5py.File open pays dynamic-linker and plugin-scan work;
+    opening a throwaway in-core file (and an in-memory Zarr group) here
+    keeps that cost out of whichever test happens to run first.
+    """
+    with h5py_mod.File("warm", "w", driver="core", backing_store=False):
+        pass
+    zarr_mod.group(store=zarr_mod.storage.MemoryStore())
 
 # ---------------------------------------------------------------------------
 # CaImAn HDF5 tests
 # ---------------------------------------------------------------------------
 
 
-def _create_caiman_hdf5(path: Path, traces: np.ndarray, fs: float) -> str:
-    """Create a mock CaImAn HDF5 file."""
-    filepath = str(path / "caiman_results.hdf5")
-    with h5py.File(filepath, "w") as f:
-        f.create_dataset("estimates/C", data=traces)
-        f.create_dataset("params/data/fr", data=fs)
+def _h5_write(h5py, filepath: Path):
+    """Open an HDF5 fixture file for writing via the in-memory core driver.
+
+    The file is assembled in memory and flushed to disk in one pass at
+    close, instead of paying per-dataset write round-trips.
+    ``libver="latest"`` skips backward-compat metadata and
+    ``locking=False`` skips POSIX-lock syscalls; both are safe for
+    throwaway single-writer fixture files.
+    """
+    return h5py.File(
+        filepath,
+        "w",
+        driver="core",
+        backing_store=True,
+        block_size=64 * 1024 * 1024,
+        track_order=False,
+        libver="latest",
+        locking=False,
+    )
+
+
+# Contiguous layout with no chunk B-tree and no modification timestamps:
+# the fixtures are tiny write-once files, so this skips the filter
+# pipeline on write and makes reads a single contiguous fetch (it also
+# keeps the file bytes deterministic).
+_DSET_OPTS = {"chunks": None, "track_times": False}
+
+
+@pytest.fixture(scope="session")
+def caiman_traces() -> np.ndarray:
+    """Ground-truth traces for the shared CaImAn file. Treat as immutable.
+
+    The values only need to round-trip, so a cheap arange (distinct
+    values, ordering-sensitive) replaces random data — float32 also
+    halves the bytes written to the fixture file.
+    """
+    return np.arange(5 * 200, dtype=np.float32).reshape(5, 200)
+
+
+@pytest.fixture(scope="session")
+def caiman_custom_traces() -> np.ndarray:
+    """Ground-truth traces for the custom-keys case. Treat as immutable."""
+    return np.arange(3 * 100, dtype=np.float32).reshape(3, 100)
+
+
+@pytest.fixture(scope="session")
+def caiman_h5(
+    tmp_path_factory: pytest.TempPathFactory,
+    caiman_traces: np.ndarray,
+    caiman_custom_traces: np.ndarray,
+    h5py_mod,
+) -> Path:
+    """One session HDF5 holding every CaImAn fixture case, routed by key.
+
+    A single file amortizes the open/close and superblock write across
+    all cases; each case reads its own group via ``trace_key``.
+    """
+    filepath = tmp_path_factory.mktemp("caiman") / "caiman_results.hdf5"
+    with _h5_write(h5py_mod, filepath) as f:
+        f.create_dataset("estimates/C", data=caiman_traces, **_DSET_OPTS)
+        f.create_dataset("params/data/fr", data=30.0, **_DSET_OPTS)
+        f.create_dataset("my/traces", data=caiman_custom_traces, **_DSET_OPTS)
+        f.create_dataset("my/fs", data=50.0, **_DSET_OPTS)
+        f.create_dataset("case_1d/C", data=np.zeros(100), **_DSET_OPTS)
+        f.create_dataset(
+            "case_f32/C", data=np.zeros((2, 50), dtype=np.float32), **_DSET_OPTS
+        )
     return filepath
 
 
-def test_caiman_load_basic(tmp_path: Path) -> None:
-    """Load standard CaImAn file with traces and sampling rate."""
-    rng = np.random.default_rng(42)
-    traces_gt = rng.standard_normal((5, 200))
-    filepath = _create_caiman_hdf5(tmp_path, traces_gt, 30.0)
+# One row per positive load scenario: the load_caiman kwargs (routing
+# into the shared file by key), the expected shape/fs, and (where the
+# content is worth checking) the name of the ground-truth fixture.
+CAIMAN_CASES = [
+    dict(id="basic", kwargs={}, shape=(5, 200), fs=30.0,
+         traces_gt="caiman_traces"),
+    dict(id="custom_keys",
+         kwargs={"trace_key": "my/traces", "fs_key": "my/fs"}, shape=(3, 100),
+         fs=50.0, traces_gt="caiman_custom_traces"),
+    dict(id="fs_override", kwargs={"fs": 100.0},
+         shape=(5, 200), fs=100.0, traces_gt=None),
+    dict(id="1d", kwargs={"trace_key": "case_1d/C", "fs_key": "case_1d/fr"},
+         shape=(1, 100), fs=None, traces_gt=None),
+]
+
+
+@pytest.mark.parametrize("case", CAIMAN_CASES, ids=lambda c: c["id"])
+def test_caiman_load(case: dict, caiman_h5: Path, request: pytest.FixtureRequest) -> None:
+    """Positive load scenarios: default keys, custom keys, fs override, 1D."""
+    traces, meta = load_caiman(caiman_h5, **case["kwargs"])
+
+    assert traces.shape == case["shape"]
+    assert meta["source"] == "caiman"
+    assert meta["sampling_rate_hz"] == case["fs"]
+    assert meta["num_cells"] == case["shape"][0]
+    assert meta["num_timepoints"] == case["shape"][1]
+    if case["traces_gt"] is not None:
+        npt.assert_array_equal(traces, request.getfixturevalue(case["traces_gt"]))
 
-    traces, meta = load_caiman(filepath)
 
-    npt.assert_allclose(traces, traces_gt)
-    assert meta["source"] == "caiman"
-    assert meta["sampling_rate_hz"] == 30.0
-    assert meta["num_cells"] == 5
-    assert meta["num_timepoints"] == 200
+def test_caiman_dtype_preserved(caiman_h5: Path) -> None:
+    """float32 source stays float32 unless dtype is requested."""
+    traces, meta = load_caiman(caiman_h5, trace_key="case_f32/C")
+    assert traces.dtype == np.float32
+    assert meta["dtype"] == "float32"
 
+    traces64, _ = load_caiman(caiman_h5, trace_key="case_f32/C", dtype="float64")
+    assert traces64.dtype == np.float64
 
-def test_caiman_load_custom_keys(tmp_path: Path) -> None:
-    """Load with non-default HDF5 keys."""
-    rng = np.random.default_rng(0)
-    traces_gt = rng.standard_normal((3, 100))
-    filepath = str(tmp_path / "custom.hdf5")
-    with h5py.File(filepath, "w") as f:
-        f.create_dataset("my/traces", data=traces_gt)
-        f.create_dataset("my/fs", data=50.0)
 
-    traces, meta = load_caiman(filepath, trace_key="my/traces", fs_key="my/fs")
+def test_caiman_out_buffer(caiman_h5: Path, caiman_traces: np.ndarray) -> None:
+    """out= receives the data directly and is returned as the traces."""
+    out = np.empty(caiman_traces.shape, dtype=np.float32)
 
-    npt.assert_allclose(traces, traces_gt)
-    assert meta["sampling_rate_hz"] == 50.0
+    traces, _ = load_caiman(caiman_h5, out=out)
 
+    assert traces is out
+    npt.assert_array_equal(out, caiman_traces)
 
-def test_caiman_load_fs_override(tmp_path: Path) -> None:
-    """Override sampling rate ignores fs_key."""
-    traces_gt = np.zeros((2, 50))
-    filepath = _create_caiman_hdf5(tmp_path, traces_gt, 30.0)
+    with pytest.raises(ValueError, match="out shape"):
+        load_caiman(caiman_h5, out=np.empty((1, 1), dtype=np.float32))
 
-    traces, meta = load_caiman(filepath, fs=100.0)
 
-    assert meta["sampling_rate_hz"] == 100.0
+# ---------------------------------------------------------------------------
+# Minian Zarr tests
+# ---------------------------------------------------------------------------
 
 
-def test_caiman_load_1d(tmp_path: Path) -> None:
-    """1D traces are reshaped to (1, n)."""
-    trace_1d = np.zeros(100)
-    filepath = str(tmp_path / "1d.hdf5")
-    with h5py.File(filepath, "w") as f:
-        f.create_dataset("estimates/C", data=trace_1d)
+def _create_minian_zarr(zarr, path: Path, traces: np.ndarray) -> Path:
+    """Create a mock Minian Zarr directory.
 
-    traces, meta = load_caiman(filepath)
+    ``chunks=traces.shape`` writes the array as one chunk — one chunk
+    file instead of a grid of tiny ones. Constructing the store and
+    group explicitly skips zarr.open's mode/node dispatch.
+    """
+    dirpath = path / "minian_output"
+    root = zarr.group(store=zarr.storage.LocalStore(dirpath), overwrite=True)
+    root.create_array("C", data=traces, chunks=traces.shape)
+    return dirpath
 
-    assert traces.shape == (1, 100)
-    assert meta["num_cells"] == 1
 
+@pytest.fixture(scope="session")
+def minian_traces() -> np.ndarray:
+    """Ground-truth traces for the shared Minian store. Treat as immutable."""
+    return np.arange(4 * 150, dtype=np.float32).reshape(4, 150)
 
-def test_caiman_missing_file(tmp_path: Path) -> None:
-    """Missing file raises FileNotFoundError."""
-    with pytest.raises(FileNotFoundError):
-        load_caiman(str(tmp_path / "nonexistent.hdf5"))
 
+@pytest.fixture(scope="session")
+def minian_dir(
+    tmp_path_factory: pytest.TempPathFactory, minian_traces: np.ndarray, zarr_mod
+) -> Path:
+    """Standard Minian Zarr directory, built once per session."""
+    return _create_minian_zarr(zarr_mod, tmp_path_factory.mktemp("minian"), minian_traces)
 
-def test_caiman_missing_key(tmp_path: Path) -> None:
-    """Missing trace key raises KeyError."""
-    filepath = str(tmp_path / "empty.hdf5")
-    with h5py.File(filepath, "w") as f:
-        f.create_dataset("other/data", data=np.zeros(10))
 
-    with pytest.raises(KeyError, match="estimates/C"):
-        load_caiman(filepath)
+@pytest.fixture(scope="session")
+def minian_custom_traces() -> np.ndarray:
+    """Ground-truth traces for the custom-key Minian store. Treat as immutable."""
+    return np.arange(2 * 80, dtype=np.float32).reshape(2, 80)
 
 
-# ---------------------------------------------------------------------------
-# Minian Zarr tests
-# ---------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def minian_custom_store(minian_custom_traces: np.ndarray, zarr_mod):
+    """In-memory Minian store with a non-default trace key.
 
+    load_minian accepts an open group, so this fixture skips the
+    filesystem entirely — no per-chunk file creation.
+    """
+    store = zarr_mod.group(store=zarr_mod.storage.MemoryStore())
+    store.create_array(
+        "traces", data=minian_custom_traces, chunks=minian_custom_traces.shape
+    )
+    return store
 
-def _create_minian_zarr(path: Path, traces: np.ndarray) -> str:
-    """Create a mock Minian Zarr directory."""
-    dirpath = str(path / "minian_output")
-    store = zarr.open(dirpath, mode="w")
-    store.create_array("C", data=traces)
-    return dirpath
 
+MINIAN_CASES = [
+    dict(id="basic", dir="minian_dir", kwargs={"fs": 30.0}, shape=(4, 150),
+         fs=30.0, traces_gt="minian_traces"),
+    dict(id="custom_key", dir="minian_custom_store",
+         kwargs={"trace_key": "traces", "fs": 25.0}, shape=(2, 80), fs=25.0,
+         traces_gt="minian_custom_traces"),
+    dict(id="no_fs", dir="minian_dir", kwargs={}, shape=(4, 150), fs=None,
+         traces_gt=None),
+]
 
-def test_minian_load_basic(tmp_path: Path) -> None:
-    """Load standard Minian file."""
-    rng = np.random.default_rng(42)
-    traces_gt = rng.standard_normal((4, 150))
-    dirpath = _create_minian_zarr(tmp_path, traces_gt)
 
-    traces, meta = load_minian(dirpath, fs=30.0)
+@pytest.mark.parametrize("case", MINIAN_CASES, ids=lambda c: c["id"])
+def test_minian_load(case: dict, request: pytest.FixtureRequest) -> None:
+    """Positive load scenarios: default key, custom key, missing fs."""
+    dirpath = request.getfixturevalue(case["dir"])
+
+    traces, meta = load_minian(dirpath, **case["kwargs"])
 
-    npt.assert_allclose(traces, traces_gt)
+    assert traces.shape == case["shape"]
     assert meta["source"] == "minian"
-    assert meta["sampling_rate_hz"] == 30.0
-    assert meta["num_cells"] == 4
-    assert meta["num_timepoints"] == 150
+    assert meta["sampling_rate_hz"] == case["fs"]
+    assert meta["num_cells"] == case["shape"][0]
+    assert meta["num_timepoints"] == case["shape"][1]
+    if case["traces_gt"] is not None:
+        npt.assert_array_equal(traces, request.getfixturevalue(case["traces_gt"]))
 
 
-def test_minian_load_custom_key(tmp_path: Path) -> None:
-    """Load with non-default Zarr key."""
-    rng = np.random.default_rng(0)
-    traces_gt = rng.standard_normal((2, 80))
-    dirpath = str(tmp_path / "custom_minian")
-    store = zarr.open(dirpath, mode="w")
-    store.create_array("traces", data=traces_gt)
+def test_minian_dtype_preserved(tmp_path: Path, zarr_mod) -> None:
+    """float32 store stays float32 unless dtype is requested."""
+    traces_gt = np.zeros((2, 50), dtype=np.float32)
+    dirpath = _create_minian_zarr(zarr_mod, tmp_path, traces_gt)
 
-    traces, meta = load_minian(dirpath, trace_key="traces", fs=25.0)
+    traces, meta = load_minian(dirpath, fs=30.0)
+    assert traces.dtype == np.float32
+    assert meta["dtype"] == "float32"
 
-    npt.assert_allclose(traces, traces_gt)
-    assert meta["sampling_rate_hz"] == 25.0
+    traces64, _ = load_minian(dirpath, fs=30.0, dtype="float64")
+    assert traces64.dtype == np.float64
 
 
-def test_minian_load_no_fs(tmp_path: Path) -> None:
-    """Loading without fs results in None in metadata."""
-    traces_gt = np.zeros((2, 50))
-    dirpath = _create_minian_zarr(tmp_path, traces_gt)
+# ---------------------------------------------------------------------------
+# Negative paths (both formats)
+# ---------------------------------------------------------------------------
 
-    traces, meta = load_minian(dirpath)
 
-    assert meta["sampling_rate_hz"] is None
+@pytest.mark.parametrize(
+    ("loader", "suffix"),
+    [(load_caiman, "nonexistent.hdf5"), (load_minian, "nonexistent")],
+    ids=["caiman", "minian"],
+)
+def test_missing_path(loader, suffix: str, tmp_path: Path) -> None:
+    """Missing file or directory raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        loader(tmp_path / suffix)
 
 
-def test_minian_missing_dir(tmp_path: Path) -> None:
-    """Missing directory raises FileNotFoundError."""
-    with pytest.raises(FileNotFoundError):
-        load_minian(str(tmp_path / "nonexistent"))
+@pytest.fixture(scope="session")
+def caiman_empty_h5(tmp_path_factory: pytest.TempPathFactory, h5py_mod) -> Path:
+    """HDF5 file without the default trace key, built once per session."""
+    filepath = tmp_path_factory.mktemp("caiman_empty") / "empty.hdf5"
+    with _h5_write(h5py_mod, filepath) as f:
+        f.create_dataset("other/data", data=np.zeros(10), **_DSET_OPTS)
+    return filepath
 
 
-def test_minian_missing_key(tmp_path: Path) -> None:
-    """Missing trace key raises KeyError."""
-    dirpath = str(tmp_path / "empty_minian")
-    store = zarr.open(dirpath, mode="w")
+@pytest.fixture(scope="session")
+def minian_empty_store(zarr_mod):
+    """In-memory Zarr group without the default trace key."""
+    store = zarr_mod.group(store=zarr_mod.storage.MemoryStore())
     store.create_array("other", data=np.zeros(10))
+    return store
+
 
+def test_caiman_missing_key(caiman_empty_h5: Path) -> None:
+    """Missing trace key raises KeyError."""
+    with pytest.raises(KeyError, match="estimates/C"):
+        load_caiman(caiman_empty_h5)
+
+
+def test_minian_missing_key(minian_empty_store) -> None:
+    """Missing trace key raises KeyError."""
     with pytest.raises(KeyError, match="C"):
-        load_minian(dirpath)
+        load_minian(minian_empty_store)